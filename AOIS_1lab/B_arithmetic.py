@@ -0,0 +1,136 @@
+from collections import namedtuple
+from constans import BITS_DEFAULT
+
+# Состояние регистров после одного такта. Трассы отдаются генераторами,
+# поэтому длинная трасса не хранится в памяти целиком.
+MultiplierStep = namedtuple('MultiplierStep', ['cycle', 'accumulator', 'multiplier', 'action'])
+BoothStep = namedtuple('BoothStep', ['cycle', 'digit', 'partial_product', 'accumulator'])
+DividerStep = namedtuple('DividerStep', ['cycle', 'remainder', 'quotient', 'action'])
+
+
+class ShiftAddMultiplier:
+    """Умножение модулей сдвигом и сложением (регистры A, Q), знак — отдельно, как в прямом коде"""
+
+    def __init__(self, n1, n2, bits=BITS_DEFAULT):
+        self.negative = (n1 < 0) != (n2 < 0)
+        self.multiplicand = abs(n1)
+        self.multiplier = abs(n2)
+        self.cycles = max(bits, self.multiplier.bit_length())
+
+    def steps(self):
+        accumulator = 0
+        multiplier = self.multiplier
+        for cycle in range(1, self.cycles + 1):
+            if multiplier & 1:
+                accumulator += self.multiplicand
+                action = 'A += M; сдвиг'
+            else:
+                action = 'сдвиг'
+            # Общий сдвиг вправо пары (A, Q): младший бит A переходит в старший бит Q
+            multiplier = (multiplier >> 1) | ((accumulator & 1) << (self.cycles - 1))
+            accumulator >>= 1
+            yield MultiplierStep(cycle, accumulator, multiplier, action)
+
+    def result(self):
+        accumulator, multiplier = 0, self.multiplier
+        for step in self.steps():
+            accumulator, multiplier = step.accumulator, step.multiplier
+        product = (accumulator << self.cycles) | multiplier
+        return -product if self.negative else product
+
+
+class BoothMultiplier:
+    """Умножение в дополнительном коде с перекодировкой Бута по основанию 4"""
+
+    # (y[i+1], y[i], y[i-1]) -> цифра множителя из {-2, -1, 0, 1, 2}
+    _DIGITS = (0, 1, 1, 2, -2, -1, -1, 0)
+
+    def __init__(self, n1, n2, bits=BITS_DEFAULT):
+        self.multiplicand = n1
+        self.multiplier = n2
+        width = max(bits, n2.bit_length() + 1)
+        self.cycles = (width + 1) // 2
+
+    def steps(self):
+        accumulator = 0
+        # Множитель с нулём справа: тройки битов (y[2i+1], y[2i], y[2i-1]) читаются сдвигом
+        extended = self.multiplier << 1
+        for cycle in range(self.cycles):
+            digit = self._DIGITS[(extended >> (2 * cycle)) & 0b111]
+            partial_product = (digit * self.multiplicand) << (2 * cycle)
+            accumulator += partial_product
+            yield BoothStep(cycle + 1, digit, partial_product, accumulator)
+
+    def result(self):
+        accumulator = 0
+        for step in self.steps():
+            accumulator = step.accumulator
+        return accumulator
+
+
+class NonRestoringDivider:
+    """Деление модулей без восстановления остатка.
+
+    Частное получается с precision дробными битами точно: делимое сдвигается
+    на precision разрядов, и все вычисления идут в целых числах.
+    """
+
+    def __init__(self, dividend, divisor, precision=5):
+        if divisor == 0:
+            raise ZeroDivisionError("Деление на ноль")
+        self.negative = (dividend < 0) != (divisor < 0)
+        self.dividend = abs(dividend) << precision
+        self.divisor = abs(divisor)
+        self.precision = precision
+        self.cycles = max(self.dividend.bit_length(), 1)
+
+    def steps(self):
+        remainder = 0
+        quotient = 0
+        for cycle in range(1, self.cycles + 1):
+            bit = (self.dividend >> (self.cycles - cycle)) & 1
+            if remainder >= 0:
+                remainder = ((remainder << 1) | bit) - self.divisor
+                action = 'R = 2R - D'
+            else:
+                remainder = ((remainder << 1) | bit) + self.divisor
+                action = 'R = 2R + D'
+            quotient = (quotient << 1) | (remainder >= 0)
+            yield DividerStep(cycle, remainder, quotient, action)
+
+    def result(self):
+        """Возвращает (модуль частного, сдвинутый на precision бит; остаток)"""
+        remainder, quotient = 0, 0
+        for step in self.steps():
+            remainder, quotient = step.remainder, step.quotient
+        if remainder < 0:
+            remainder += self.divisor
+        return quotient, remainder
+
+
+class LongDivider:
+    """Точное деление целых чисел любой длины с выдачей битов частного по требованию.
+
+    Целая часть получается одним divmod, дробные биты — порциями по chunk_bits:
+    остаток сдвигается на всю порцию сразу, поэтому на порцию приходится одно
+    деление длинных чисел, а не chunk_bits сравнений.
+    """
+
+    def __init__(self, dividend, divisor):
+        if divisor == 0:
+            raise ZeroDivisionError("Деление на ноль")
+        self.negative = (dividend < 0) != (divisor < 0)
+        self.divisor = abs(divisor)
+        self.integer_part, self.remainder = divmod(abs(dividend), self.divisor)
+
+    def bits(self, chunk_bits=64):
+        """Бесконечный генератор дробных битов модуля частного, старший первым"""
+        remainder = self.remainder
+        while True:
+            chunk, remainder = divmod(remainder << chunk_bits, self.divisor)
+            for shift in range(chunk_bits - 1, -1, -1):
+                yield (chunk >> shift) & 1
+
+    def fraction(self, precision):
+        """Первые precision дробных битов одним целым и остаток после них"""
+        return divmod(self.remainder << precision, self.divisor)
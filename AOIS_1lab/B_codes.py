@@ -0,0 +1,207 @@
+from array import array
+from functools import lru_cache
+from constans import BITS_DEFAULT, BCD_8421
+from B_vector import BitVector
+from B_lanes import pack_lanes, repeat_lanes, unpack_lanes, unsigned_typecode
+
+# Байт-метка в таблицах перекодировки: тетрады не больше 15, поэтому 0xFF не бывает кодом
+_INVALID = 0xFF
+_ZERO = ord('0')
+
+
+class CodeConverter:
+    """Двоично-десятичные коды (8421, 2421, excess-3, Грея) и код Грея для целых чисел.
+
+    Скалярные методы работают со строками битов, пакетные — с буферами байтов:
+    перекодировка массива — один bytes.translate по таблице на 256 байт.
+    """
+
+    @staticmethod
+    def encode(number, code=BCD_8421):
+        """Неотрицательное число -> строка тетрад, старшая цифра первой"""
+        if number < 0:
+            raise ValueError(f"Число {number} отрицательное: двоично-десятичный код не определён!")
+        strings = CodeConverter._tetrad_strings(code)
+        return ''.join(strings[digit - _ZERO] for digit in str(number).encode())
+
+    @staticmethod
+    def decode(binary_str, code=BCD_8421):
+        if not binary_str or len(binary_str) % 4:
+            raise ValueError(f"Длина строки {binary_str!r} не кратна 4!")
+        digits = CodeConverter._decode_table(code)
+        result = 0
+        for start in range(0, len(binary_str), 4):
+            digit = digits[int(binary_str[start:start + 4], 2)]
+            if digit == _INVALID:
+                raise ValueError(f"Тетрада {binary_str[start:start + 4]} не является кодом {code.name}!")
+            result = result * 10 + digit
+        return result
+
+    @staticmethod
+    def gray_encode(n, bits=BITS_DEFAULT):
+        if not (0 <= n < (1 << bits)):
+            raise ValueError(f"Число {n} выходит за допустимый диапазон для {bits} битов!")
+        return BitVector(n ^ (n >> 1), bits).to_str()
+
+    @staticmethod
+    def gray_decode(binary_str):
+        # Префиксный XOR: после сдвигов на 1, 2, 4, ... каждый бит равен XOR всех старших
+        value = int(binary_str, 2)
+        shift = 1
+        while shift < len(binary_str):
+            value ^= value >> shift
+            shift <<= 1
+        return value
+
+    @staticmethod
+    def encode_batch(digits, code=BCD_8421):
+        """Массив цифр 0..9 (bytes, array('B'), список) -> bytes тетрад"""
+        return CodeConverter._translate(digits, CodeConverter._encode_table(code), "цифрой")
+
+    @staticmethod
+    def decode_batch(tetrads, code=BCD_8421):
+        return CodeConverter._translate(tetrads, CodeConverter._decode_table(code), f"кодом {code.name}")
+
+    @staticmethod
+    def transcode_batch(tetrads, source, target):
+        """Перевод тетрад из кода source в код target одним проходом"""
+        return CodeConverter._translate(tetrads, CodeConverter._transcode_table(source, target),
+                                        f"кодом {source.name}")
+
+    @staticmethod
+    def encode_numbers_batch(numbers, digits, code=BCD_8421, packed=False):
+        """Кодирует массив неотрицательных чисел по digits цифр на число.
+
+        Без packed — одна тетрада на байт, с packed — две тетрады на байт (старшая в
+        старшем полубайте); при нечётном digits числа дополняются ведущим нулём.
+        """
+        if packed and digits % 2:
+            digits += 1
+        if len(numbers) and (min(numbers) < 0 or max(numbers) >= 10 ** digits):
+            bad = next(n for n in numbers if not (0 <= n < 10 ** digits))
+            raise ValueError(f"Число {bad} не помещается в {digits} десятичных цифр!")
+        # Десятичная запись всех чисел сразу — это ASCII-цифры, которые переводятся одной таблицей
+        text = ''.join(map(f'{{:0{digits}d}}'.format, numbers)).encode()
+        tetrads = text.translate(CodeConverter._ascii_table(code))
+        return CodeConverter._pack_tetrads(tetrads) if packed else tetrads
+
+    @staticmethod
+    def decode_numbers_batch(data, digits, code=BCD_8421, packed=False):
+        """Обратное к encode_numbers_batch: возвращает array('Q') чисел"""
+        if packed and digits % 2:
+            digits += 1
+        tetrads = CodeConverter._unpack_tetrads(bytes(data)) if packed else bytes(data)
+        text = CodeConverter._translate(tetrads, CodeConverter._decode_ascii_table(code), f"кодом {code.name}")
+        return array('Q', map(int, (text[start:start + digits] for start in range(0, len(text), digits))))
+
+    @staticmethod
+    def gray_encode_batch(values, bits=BITS_DEFAULT):
+        """Код Грея для массива беззнаковых чисел (SWAR: весь массив — одно длинное целое)"""
+        words, lane, count = CodeConverter._lanes(values, bits)
+        packed = pack_lanes(words)
+        packed ^= (packed >> 1) & repeat_lanes((1 << (lane - 1)) - 1, lane // 8, count)
+        return unpack_lanes(packed, words.format, count)
+
+    @staticmethod
+    def gray_decode_batch(values, bits=BITS_DEFAULT):
+        words, lane, count = CodeConverter._lanes(values, bits)
+        packed = pack_lanes(words)
+        shift = 1
+        while shift < lane:
+            # Маска отрезает биты, перешедшие при сдвиге из соседнего (старшего) слова
+            packed ^= (packed >> shift) & repeat_lanes((1 << (lane - shift)) - 1, lane // 8, count)
+            shift <<= 1
+        return unpack_lanes(packed, words.format, count)
+
+    @staticmethod
+    def truth_table(source, target, transform=None, fill=0):
+        """Таблица истинности преобразования тетрады кода source в тетраду кода target.
+
+        Строки идут по всем 16 входным тетрадам: 4 входных бита, затем 4 выходных.
+        transform — необязательная функция над цифрой (например, d -> (d + 5) % 10).
+        Для тетрад, не являющихся кодом source, выходы равны fill (None — безразличные).
+        """
+        digits = CodeConverter._decode_table(source)
+        table = []
+        for tetrad in range(16):
+            digit = digits[tetrad]
+            if digit == _INVALID:
+                outputs = [fill] * 4
+            else:
+                result = target.tetrads[transform(digit) if transform else digit]
+                outputs = [(result >> shift) & 1 for shift in (3, 2, 1, 0)]
+            table.append([(tetrad >> shift) & 1 for shift in (3, 2, 1, 0)] + outputs)
+        return table
+
+    @staticmethod
+    def _translate(data, table, what):
+        result = bytes(data).translate(table)
+        if _INVALID in result:
+            position = result.index(_INVALID)
+            raise ValueError(f"Значение {bytes(data)[position]} в позиции {position} не является {what}!")
+        return result
+
+    @staticmethod
+    def _pack_tetrads(tetrads):
+        # Старшие тетрады пар сдвигаются на полубайт: значения < 16, перенос в соседний байт невозможен
+        high = int.from_bytes(tetrads[0::2], 'big')
+        low = int.from_bytes(tetrads[1::2], 'big')
+        return ((high << 4) | low).to_bytes(len(tetrads) // 2, 'big')
+
+    @staticmethod
+    def _unpack_tetrads(data):
+        packed = int.from_bytes(data, 'big')
+        low_mask = int.from_bytes(b'\x0f' * len(data), 'big')
+        tetrads = bytearray(len(data) * 2)
+        tetrads[0::2] = ((packed >> 4) & low_mask).to_bytes(len(data), 'big')
+        tetrads[1::2] = (packed & low_mask).to_bytes(len(data), 'big')
+        return bytes(tetrads)
+
+    @staticmethod
+    def _lanes(values, bits):
+        typecode = unsigned_typecode(bits)
+        words = memoryview(array(typecode, values) if isinstance(values, (list, tuple)) else values)
+        words = words.cast('B').cast(typecode)
+        if len(words) and max(words) >> bits:
+            bad = next(value for value in words if value >> bits)
+            raise ValueError(f"Число {bad} выходит за допустимый диапазон для {bits} битов!")
+        return words, words.itemsize * 8, len(words)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _tetrad_strings(code):
+        return tuple(format(tetrad, '04b') for tetrad in code.tetrads)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _encode_table(code):
+        table = bytearray([_INVALID]) * 256
+        table[:10] = bytes(code.tetrads)
+        return bytes(table)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _decode_table(code):
+        table = bytearray([_INVALID]) * 256
+        for digit, tetrad in enumerate(code.tetrads):
+            table[tetrad] = digit
+        return bytes(table)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _transcode_table(source, target):
+        return bytes(target.tetrads[digit] if digit != _INVALID else _INVALID
+                     for digit in CodeConverter._decode_table(source))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _ascii_table(code):
+        table = bytearray(range(256))
+        table[_ZERO:_ZERO + 10] = bytes(code.tetrads)
+        return bytes(table)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _decode_ascii_table(code):
+        return bytes(digit + _ZERO if digit != _INVALID else _INVALID
+                     for digit in CodeConverter._decode_table(code))
@@ -1,59 +1,182 @@
-from constans import BITS_DEFAULT
+import sys
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+from constans import BITS_DEFAULT, TABLE_WIDTHS
+from B_vector import BitVector
+from B_lanes import pack_lanes, repeat_lanes, unpack_lanes, unsigned_typecode
 
 class BinaryConverter:
     @staticmethod
     def dec_to_bin(n, bits=BITS_DEFAULT):
-        min_val = -(2 ** (bits - 1))
-        max_val = 2 ** (bits - 1) - 1
+        if bits in TABLE_WIDTHS:
+            return BinaryConverter._code_table(bits)[BinaryConverter.table_index(n, bits)]
+        code = BitVector.from_signed(n, bits)
+        return code.direct().to_str(), code.inverse().to_str(), code.complement().to_str()
 
-        if not (min_val <= n <= max_val):
-            raise ValueError(f"Число {n} выходит за допустимый диапазон для {bits} битов!")
+    @staticmethod
+    def dec_to_bin_batch(numbers, bits=BITS_DEFAULT, packed=False):
+        """Переводит массив целых чисел сразу в прямой, обратный и дополнительный коды.
 
-        # Прямой код
-        if n >= 0:
-            direct_code = BinaryConverter.int_to_binary(n, bits)
-            inverse_code = direct_code
-            complement_code = direct_code
+        numbers — list/tuple, array или любой объект с протоколом буфера (memoryview).
+        Коды возвращаются массивами беззнаковых целых (array/memoryview), а при packed=True —
+        упакованными матрицами битов: ceil(bits / 8) байт на число, старший бит первым.
+        """
+        mask = (1 << bits) - 1
+        sign = 1 << (bits - 1)
+        typecode = unsigned_typecode(bits)
+        complement = BinaryConverter.to_complement_batch(numbers, bits)
+
+        if complement.itemsize * 8 == bits:
+            direct, inverse = BinaryConverter._sign_magnitude_batch(complement, bits, typecode)
         else:
-            abs_n = abs(n)
-            direct_code = '1' + BinaryConverter.int_to_binary(abs_n, bits - 1)
-            inverse_code = '1' + ''.join('1' if b == '0' else '0' for b in direct_code[1:])
-            complement_code = BinaryConverter.add_one(inverse_code)
+            direct = array(typecode, [c if not c & sign else sign | (-c & mask) for c in complement])
+            inverse = array(typecode, [d if not d & sign else d ^ (sign - 1) for d in direct])
 
-        return direct_code, inverse_code, complement_code
+        if packed:
+            return tuple(BinaryConverter._pack_codes(codes, bits) for codes in (direct, inverse, complement))
+        return direct, inverse, complement
 
     @staticmethod
-    def int_to_binary(n, bits):
-        binary_str = ''
-        for _ in range(bits):
-            binary_str = str(n % 2) + binary_str
-            n //= 2
+    def to_complement_batch(numbers, bits=BITS_DEFAULT):
+        """Дополнительные коды массива чисел (с проверкой диапазона)"""
+        view = BinaryConverter._as_signed_view(numbers, bits)
+        typecode = unsigned_typecode(bits)
+        if view is not None:
+            # Знаковый буфер нужной ширины уже хранит дополнительный код — отдаём его без копии
+            return view.cast('B').cast(typecode)
 
-        return binary_str.zfill(bits)
+        values = numbers if hasattr(numbers, '__len__') else list(numbers)
+        BinaryConverter._check_range_batch(values, -(1 << (bits - 1)), (1 << (bits - 1)) - 1, bits)
+        return array(typecode, map(((1 << bits) - 1).__and__, values))
 
     @staticmethod
-    def add_one(binary_str):
-        binary_list = list(binary_str)
-        carry = 1
-
-        for i in range(len(binary_list) - 1, -1, -1):
-            if binary_list[i] == '0':
-                binary_list[i] = '1'
-                carry = 0
-                break
+    def _sign_magnitude_batch(complement, bits, typecode):
+        """Получает прямой и обратный коды из дополнительных для всего массива сразу"""
+        raw = memoryview(complement).cast('B')
+        if bits == 8:
+            direct_table, inverse_table = BinaryConverter._byte_code_tables()
+            data = raw.tobytes()
+            return array('B', data.translate(direct_table)), array('B', data.translate(inverse_table))
+
+        # SWAR: все слова лежат в одном длинном целом, каждая операция обрабатывает весь массив.
+        # Для отрицательного слова c модуль равен (~c + 1) и не выходит за пределы своего слова.
+        count = len(complement)
+        packed_words = pack_lanes(raw)
+        signs = packed_words & repeat_lanes(1 << (bits - 1), bits // 8, count)
+        negative = signs >> (bits - 1)
+        magnitude_mask = signs - negative
+        direct_words = ((packed_words ^ (magnitude_mask | signs)) + negative) | signs
+        inverse_words = direct_words ^ magnitude_mask
+        return unpack_lanes(direct_words, typecode, count), unpack_lanes(inverse_words, typecode, count)
+
+    @staticmethod
+    def _check_range_batch(values, min_val, max_val, bits):
+        if len(values) and not (min_val <= min(values) and max(values) <= max_val):
+            bad = next(n for n in values if not (min_val <= n <= max_val))
+            raise ValueError(f"Число {bad} выходит за допустимый диапазон для {bits} битов!")
+
+    @staticmethod
+    def _as_signed_view(numbers, bits):
+        """Возвращает memoryview, если numbers — знаковый буфер ровно на bits бит"""
+        try:
+            view = memoryview(numbers)
+        except TypeError:
+            return None
+        if view.format in ('b', 'h', 'i', 'l', 'q') and view.itemsize * 8 == bits and view.c_contiguous and view.ndim == 1:
+            return view
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _byte_code_tables():
+        direct = bytearray(256)
+        inverse = bytearray(256)
+        for byte in range(256):
+            n = byte - 256 if byte & 0x80 else byte
+            direct[byte] = byte if n >= 0 else 0x80 | (-n & 0x7F)
+            inverse[byte] = byte if n >= 0 else direct[byte] ^ 0x7F
+        return bytes(direct), bytes(inverse)
+
+    @staticmethod
+    def table_index(n, bits):
+        """Дополнительный код n как индекс в таблицах (с проверкой диапазона)"""
+        half = 1 << (bits - 1)
+        if not (-half <= n < half):
+            raise ValueError(f"Число {n} выходит за допустимый диапазон для {bits} битов!")
+        return n & ((half << 1) - 1)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def bit_strings(bits):
+        """Двоичные строки всех комбинаций ширины bits, индекс — сама комбинация"""
+        fmt = f'0{bits}b'
+        return tuple(format(value, fmt) for value in range(1 << bits))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _code_table(bits):
+        """(прямой, обратный, дополнительный) для каждого дополнительного кода.
+
+        Строки не копируются: все три кода ссылаются на общую таблицу bit_strings.
+        """
+        strings = BinaryConverter.bit_strings(bits)
+        sign = 1 << (bits - 1)
+        table = []
+        for code, complement in enumerate(strings):
+            if code < sign:
+                table.append((complement, complement, complement))
             else:
-                binary_list[i] = '0'
+                direct = sign | (-code & (sign - 1))
+                table.append((strings[direct], strings[direct ^ (sign - 1)], complement))
+        return tuple(table)
+
+    @staticmethod
+    def _pack_codes(codes, bits):
+        nbytes = (bits + 7) // 8
+        if codes.itemsize == nbytes:
+            if sys.byteorder == 'little' and nbytes > 1:
+                swapped = array(codes.format if isinstance(codes, memoryview) else codes.typecode, codes)
+                swapped.byteswap()
+                return swapped.tobytes()
+            return bytes(codes)
+        return b''.join(code.to_bytes(nbytes, 'big') for code in codes)
 
-        return ''.join(binary_list)
+    @staticmethod
+    def int_to_binary(n, bits):
+        return BitVector(n, bits).to_str()
 
     @staticmethod
-    def bin_to_dec(binary_str):
+    def add_one(binary_str):
+        return BitVector.from_str(binary_str).increment().to_str()
+
+    @staticmethod
+    def bin_to_dec(binary_str, result_type=float):
+        """Значение двоичной строки с точкой; result_type — float, Fraction или Decimal.
+
+        Fraction и Decimal точны при любой длине дробной части: k двоичных
+        знаков после точки — это ровно k десятичных знаков.
+        """
+        if binary_str.startswith('-'):
+            value = BinaryConverter.bin_to_dec(binary_str[1:], result_type)
+            # Унарный минус Decimal округляет до точности контекста, copy_negate — нет
+            return value.copy_negate() if isinstance(value, Decimal) else -value
+
         if '.' in binary_str:
             int_part, frac_part = binary_str.split('.')
         else:
             int_part, frac_part = binary_str, ''
 
         decimal_value = int(int_part, 2)
-        frac_value = sum(int(bit) * (2 ** -i) for i, bit in enumerate(frac_part, start=1))
+        if not frac_part:
+            return decimal_value if result_type is float else result_type(decimal_value)
+        if result_type is Fraction:
+            return decimal_value + Fraction(int(frac_part, 2), 1 << len(frac_part))
+        if result_type is Decimal:
+            # m / 2^k = m * 5^k / 10^k; конструктор из строки точен, арифметика Decimal округляла бы
+            digits = int(int_part + frac_part, 2) * 5 ** len(frac_part)
+            return Decimal(f'{digits}E-{len(frac_part)}')
 
-        return decimal_value + frac_value
+        # Дробная часть целиком — одно целое, делится на 2^k с единственным округлением
+        return decimal_value + int(frac_part, 2) / (1 << len(frac_part))
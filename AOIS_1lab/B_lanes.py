@@ -0,0 +1,48 @@
+import sys
+from array import array
+
+# Беззнаковые типы array по возрастанию ширины
+_UNSIGNED_TYPECODES = 'BHILQ'
+
+
+def unsigned_typecode(bits):
+    """Самый узкий беззнаковый тип array, в который помещается bits бит"""
+    for typecode in _UNSIGNED_TYPECODES:
+        if array(typecode).itemsize * 8 >= bits:
+            return typecode
+    raise ValueError(f"Разрядность {bits} не помещается в машинное слово")
+
+
+def word_typecode(bits):
+    """Беззнаковый тип array шириной ровно bits бит (слово формата IEEE-754 и т. п.)"""
+    for typecode in _UNSIGNED_TYPECODES:
+        if array(typecode).itemsize * 8 == bits:
+            return typecode
+    raise ValueError(f"Нет беззнакового машинного слова шириной {bits} бит")
+
+
+# SWAR: массив слов по width байт — одно длинное целое в порядке байтов платформы,
+# каждое слово — «дорожка», и побитовые операции обрабатывают все дорожки сразу.
+
+def repeat_lanes(value, width, count):
+    """Длинное целое, в каждой из count дорожек по width байт которого записано value"""
+    return int.from_bytes(value.to_bytes(width, sys.byteorder) * count, sys.byteorder)
+
+
+def pack_lanes(words):
+    """Буфер слов -> длинное целое (без разбора по словам)"""
+    return int.from_bytes(memoryview(words).cast('B'), sys.byteorder)
+
+
+def unpack_lanes(packed, typecode, count):
+    """Длинное целое из count дорожек -> array(typecode)"""
+    words = array(typecode)
+    words.frombytes(packed.to_bytes(count * words.itemsize, sys.byteorder))
+    return words
+
+
+def low_bytes(packed, width, count):
+    """Младший байт каждой дорожки -> array('B')"""
+    raw = packed.to_bytes(count * width, sys.byteorder)
+    start = 0 if sys.byteorder == 'little' else width - 1
+    return array('B', raw[start::width])
@@ -1,40 +1,114 @@
+from collections import namedtuple
+from functools import lru_cache
 from constans import BITS_DEFAULT
 from B_converter import BinaryConverter
+from B_vector import BitVector
+from B_arithmetic import ShiftAddMultiplier, LongDivider
+from B_lanes import low_bytes, pack_lanes, repeat_lanes, unpack_lanes
+
+# Результат пакетного сумматора: коды результата и векторы флагов (0/1 на каждую пару)
+AluResult = namedtuple('AluResult', ['codes', 'carry', 'overflow', 'zero', 'sign'])
 
 class BinaryOperations:
     @staticmethod
     def add_complement(n1, n2, bits=BITS_DEFAULT):
-        _, _, comp1 = BinaryConverter.dec_to_bin(n1, bits)
-        _, _, comp2 = BinaryConverter.dec_to_bin(n2, bits)
-        result = int(comp1, 2) + int(comp2, 2)
-        result = result & ((2 ** bits) - 1)
-        result_bin = bin(result)[2:].zfill(bits)
-        result_value = int(result_bin, 2) - (1 << bits) if result_bin[0] == '1' else int(result_bin, 2)
-        return result_bin, result_value
+        if bits == 8:
+            return BinaryOperations._byte_alu(n1, n2, subtract=False)
+        result = BitVector.from_signed(n1, bits) + BitVector.from_signed(n2, bits)
+        return result.to_str(), result.to_signed()
 
     @staticmethod
     def subtract_complement(n1, n2, bits=BITS_DEFAULT):
-        return BinaryOperations.add_complement(n1, -n2, bits)
+        if bits == 8:
+            return BinaryOperations._byte_alu(n1, n2, subtract=True)
+        result = BitVector.from_signed(n1, bits) + -BitVector.from_signed(n2, bits)
+        return result.to_str(), result.to_signed()
+
+    @staticmethod
+    def _byte_alu(n1, n2, subtract):
+        """8-битные сложение и вычитание одним обращением к таблице по индексу (a << 8) | b"""
+        add_table, sub_table, results = BinaryOperations._byte_alu_tables()
+        index = (BinaryConverter.table_index(n1, 8) << 8) | BinaryConverter.table_index(n2, 8)
+        return results[(sub_table if subtract else add_table)[index]]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _byte_alu_tables():
+        # Строка a таблицы сложения — циклический сдвиг 0..255 на a, таблицы вычитания — обратный
+        ascending = bytes(range(256))
+        descending = ascending[::-1]
+        add_table = b''.join(ascending[a:] + ascending[:a] for a in range(256))
+        sub_table = b''.join(descending[255 - a:] + descending[:255 - a] for a in range(256))
+        strings = BinaryConverter.bit_strings(8)
+        results = tuple((strings[code], code - 256 if code & 0x80 else code) for code in range(256))
+        return add_table, sub_table, results
+
+    @staticmethod
+    def add_complement_batch(numbers1, numbers2, bits=BITS_DEFAULT):
+        return BinaryOperations._alu_batch(numbers1, numbers2, bits, subtract=False)
+
+    @staticmethod
+    def subtract_complement_batch(numbers1, numbers2, bits=BITS_DEFAULT):
+        """Вычитание как a + ~b + 1: carry = 1 означает отсутствие заёма"""
+        return BinaryOperations._alu_batch(numbers1, numbers2, bits, subtract=True)
+
+    @staticmethod
+    def _alu_batch(numbers1, numbers2, bits, subtract):
+        """Сумматор в дополнительном коде над массивами за один проход.
+
+        Все слова массива упаковываются в одно длинное целое (по слову на «дорожку»),
+        поэтому каждая побитовая операция обрабатывает сразу все пары операндов.
+        Младшие bits - 1 разрядов складываются без выхода переноса за пределы дорожки,
+        знаковый разряд и флаги считаются отдельно по формулам полного сумматора.
+        """
+        first = BinaryConverter.to_complement_batch(numbers1, bits)
+        second = BinaryConverter.to_complement_batch(numbers2, bits)
+        if len(first) != len(second):
+            raise ValueError("Массивы операндов должны быть одинаковой длины")
+
+        count = len(first)
+        width = first.itemsize
+        top = repeat_lanes(1 << (bits - 1), width, count)
+        low = repeat_lanes((1 << (bits - 1)) - 1, width, count)
+
+        a = pack_lanes(first)
+        b = pack_lanes(second)
+        carry_in = 0
+        if subtract:
+            b ^= top | low
+            carry_in = repeat_lanes(1, width, count)
+
+        partial = (a & low) + (b & low) + carry_in
+        result = partial ^ ((a ^ b) & top)
+        carry_into_top = partial & top
+        carry = ((a & b) | (carry_into_top & (a ^ b))) & top
+        overflow = carry ^ carry_into_top
+        nonzero = (((result & low) + low) | result) & top
+
+        codes = unpack_lanes(result, memoryview(first).format, count)
+        flags = [low_bytes(flag >> (bits - 1), width, count)
+                 for flag in (carry, overflow, top ^ nonzero, result & top)]
+        return AluResult(codes, *flags)
 
     @staticmethod
     def multiply_direct(n1, n2, bits=BITS_DEFAULT):
-        result = n1 * n2
-        result_bin = bin(result & (2 ** (bits * 2) - 1))[2:].zfill(bits * 2)
+        result = ShiftAddMultiplier(n1, n2, bits).result()
+        result_bin = BitVector(result, bits * 2).to_str()
         return result_bin, result
 
     @staticmethod
-    def divide_direct(n1, n2, bits=BITS_DEFAULT, precision=5):
+    def divide_direct(n1, n2, bits=BITS_DEFAULT, precision=5, result_type=float):
         if n2 == 0:
             return "Ошибка: деление на ноль", None
 
-        quotient = n1 / n2
-        quotient_bin = format(int(quotient), 'b').zfill(bits) + '.'
-        frac_part = quotient - int(quotient)
+        divider = LongDivider(n1, n2)
+        frac_part, _ = divider.fraction(precision)
 
-        for _ in range(precision):
-            frac_part *= 2
-            quotient_bin += '1' if frac_part >= 1 else '0'
-            frac_part -= int(frac_part)
+        quotient_bin = format(divider.integer_part, 'b').zfill(bits) + '.'
+        if precision:
+            quotient_bin += format(frac_part, f'0{precision}b')
+        if divider.negative:
+            quotient_bin = '-' + quotient_bin
 
-        quotient_dec = BinaryConverter.bin_to_dec(quotient_bin)
+        quotient_dec = BinaryConverter.bin_to_dec(quotient_bin, result_type)
         return quotient_bin, quotient_dec
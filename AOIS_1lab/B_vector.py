@@ -0,0 +1,83 @@
+class BitVector:
+    """Битовый вектор фиксированной ширины, хранящийся как целое число.
+
+    value — беззнаковая битовая комбинация (дополнительный код для знаковых чисел),
+    width — разрядность. Все коды и строки получаются целочисленными операциями,
+    без посимвольной работы со строками.
+    """
+
+    __slots__ = ('value', 'width')
+
+    def __init__(self, value, width):
+        self.value = value & ((1 << width) - 1)
+        self.width = width
+
+    @classmethod
+    def from_signed(cls, n, width):
+        if not (-(1 << (width - 1)) <= n < (1 << (width - 1))):
+            raise ValueError(f"Число {n} выходит за допустимый диапазон для {width} битов!")
+        return cls(n, width)
+
+    @classmethod
+    def from_str(cls, binary_str):
+        return cls(int(binary_str, 2), len(binary_str))
+
+    @property
+    def mask(self):
+        return (1 << self.width) - 1
+
+    @property
+    def sign_bit(self):
+        return self.value >> (self.width - 1)
+
+    def to_signed(self):
+        return self.value - (1 << self.width) if self.sign_bit else self.value
+
+    def direct(self):
+        """Прямой код (знак и модуль) числа, записанного в self дополнительным кодом"""
+        if not self.sign_bit:
+            return self
+        sign = 1 << (self.width - 1)
+        return BitVector(sign | -self.to_signed(), self.width)
+
+    def inverse(self):
+        """Обратный код: у отрицательных чисел инвертируются все разряды, кроме знакового"""
+        if not self.sign_bit:
+            return self
+        return BitVector(self.direct().value ^ ((1 << (self.width - 1)) - 1), self.width)
+
+    def complement(self):
+        """Дополнительный код — это и есть хранимая комбинация"""
+        return self
+
+    def increment(self):
+        return BitVector(self.value + 1, self.width)
+
+    def to_str(self):
+        return format(self.value, f'0{self.width}b')
+
+    def __add__(self, other):
+        return BitVector(self.value + other.value, max(self.width, other.width))
+
+    def __neg__(self):
+        return BitVector(-self.value, self.width)
+
+    def __len__(self):
+        return self.width
+
+    def __int__(self):
+        return self.value
+
+    def __eq__(self, other):
+        if not isinstance(other, BitVector):
+            return NotImplemented
+        return self.value == other.value and self.width == other.width
+
+    def __hash__(self):
+        return hash((self.value, self.width))
+
+    def __str__(self):
+        return self.to_str()
+
+    def __repr__(self):
+        return f"BitVector('{self.to_str()}')"
@@ -0,0 +1,54 @@
+import random
+import sys
+import time
+from array import array
+from constans import BINARY64, FLOAT_FORMATS, ROUND_NEAREST_EVEN, ROUND_TOWARD_ZERO
+from IEEE754_softfloat import soft_float
+from B_lanes import word_typecode
+
+
+def _random_words(soft, count):
+    """Случайные конечные числа формата: порядок ограничен, чтобы не получать NaN и бесконечности"""
+    exponent_limit = soft.max_exponent - 1
+    words = array(word_typecode(soft.total_bits))
+    for _ in range(count):
+        sign = random.getrandbits(1)
+        exponent = random.randint(soft.bias - 8, min(soft.bias + 8, exponent_limit))
+        words.append((sign << (soft.total_bits - 1)) | (exponent << soft.mantissa_bits)
+                     | random.getrandbits(soft.mantissa_bits))
+    return words
+
+
+def _throughput(function, count):
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start) / 1e6
+
+
+def run_benchmark(count=100_000):
+    """Пропускная способность (млн операций/с) для каждого формата"""
+    results = []
+    for float_format in FLOAT_FORMATS:
+        soft = soft_float(float_format)
+        first, second = _random_words(soft, count), _random_words(soft, count)
+        results.append((
+            float_format.name,
+            _throughput(lambda: soft.add_batch(first, second, ROUND_NEAREST_EVEN), count),
+            _throughput(lambda: soft.add_batch(first, second, ROUND_TOWARD_ZERO), count),
+            _throughput(lambda: soft.mul_batch(first, second, ROUND_NEAREST_EVEN), count),
+            _throughput(lambda: soft.fma_batch(first, second, first, ROUND_NEAREST_EVEN), count),
+            _throughput(lambda: soft.convert_batch(first, soft_float(BINARY64)), count),
+        ))
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Операций на формат: {count}, млн операций/с")
+    print(f"{'формат':<10} | {'add (к ближ.)':>14} | {'add (к нулю)':>13} | {'mul':>6} | {'fma':>6} | {'-> binary64':>12}")
+    for name, nearest, toward_zero, mul, fma, convert in run_benchmark(count):
+        print(f"{name:<10} | {nearest:>14.2f} | {toward_zero:>13.2f} | {mul:>6.2f} | {fma:>6.2f} | {convert:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
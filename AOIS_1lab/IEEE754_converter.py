@@ -1,45 +1,111 @@
 import struct
-from constans import IEEE754_TOTAL_BITS, IEEE754_EXPONENT_BITS, IEEE754_MANTISSA_BITS
+import sys
+from array import array
+from constans import (IEEE754_TOTAL_BITS, IEEE754_EXPONENT_BITS, IEEE754_MANTISSA_BITS, ROUND_NEAREST_EVEN,
+                      BINARY32)
+from IEEE754_softfloat import soft_float
+from B_lanes import low_bytes, pack_lanes, repeat_lanes, unpack_lanes, word_typecode
+
+# Беззнаковый тип array шириной ровно 32 бита (на большинстве платформ 'I')
+_WORD_TYPECODE = word_typecode(IEEE754_TOTAL_BITS)
+_WORD_BYTES = IEEE754_TOTAL_BITS // 8
 
 class IEEE754Converter:
     @staticmethod
-    def float_to_ieee754(num):
-        return format(struct.unpack('!I', struct.pack('!f', num))[0], f'0{IEEE754_TOTAL_BITS}b')
+    def float_to_ieee754(num, float_format=BINARY32):
+        if float_format == BINARY32:
+            return format(struct.unpack('!I', struct.pack('!f', num))[0], f'0{IEEE754_TOTAL_BITS}b')
+        return format(soft_float(float_format).from_float(num), f'0{float_format.total_bits}b')
 
     @staticmethod
-    def ieee754_to_float(ieee_binary):
-        return struct.unpack('!f', struct.pack('!I', int(ieee_binary, 2)))[0]
+    def ieee754_to_float(ieee_binary, float_format=BINARY32):
+        if float_format == BINARY32:
+            return struct.unpack('!f', struct.pack('!I', int(ieee_binary, 2)))[0]
+        return soft_float(float_format).to_float(int(ieee_binary, 2))
 
     @staticmethod
-    def sum_floats_ieee754(first_float, second_float):
-        first_binary = IEEE754Converter.float_to_ieee754(first_float)
-        second_binary = IEEE754Converter.float_to_ieee754(second_float)
+    def as_words(buffer):
+        """Представляет любой буфер (array('f'), bytes, mmap, memoryview) как uint32 без копирования.
 
-        first_exponent = int(first_binary[1:1 + IEEE754_EXPONENT_BITS], 2)
-        first_mantissa = int(first_binary[1 + IEEE754_EXPONENT_BITS:], 2) | (1 << IEEE754_MANTISSA_BITS)
+        Слова читаются в порядке байтов платформы — так же, как их записал array('f')/numpy.
+        """
+        raw = memoryview(buffer).cast('B')
+        if len(raw) % _WORD_BYTES:
+            raise ValueError(f"Размер буфера ({len(raw)} байт) не кратен {_WORD_BYTES}")
+        return raw.cast(_WORD_TYPECODE)
 
-        second_exponent = int(second_binary[1:1 + IEEE754_EXPONENT_BITS], 2)
-        second_mantissa = int(second_binary[1 + IEEE754_EXPONENT_BITS:], 2) | (1 << IEEE754_MANTISSA_BITS)
+    @staticmethod
+    def floats_to_words(floats):
+        """Кодирует последовательность чисел в массив 32-битных слов IEEE-754"""
+        return IEEE754Converter.as_words(array('f', floats))
 
-        if first_exponent > second_exponent:
-            second_mantissa >>= (first_exponent - second_exponent)
-            exponent = first_exponent
-        else:
-            first_mantissa >>= (second_exponent - first_exponent)
-            exponent = second_exponent
+    @staticmethod
+    def words_to_floats(words):
+        return IEEE754Converter.as_words(words).cast('B').cast('f')
 
-        result_mantissa = first_mantissa + second_mantissa
+    @staticmethod
+    def decode_fields(buffer):
+        """Разбирает все слова буфера на поля: (знак, порядок, мантисса).
 
-        if result_mantissa & (1 << (IEEE754_MANTISSA_BITS + 1)):
-            result_mantissa >>= 1
-            exponent += 1
+        Знак и порядок возвращаются массивами байтов, мантисса — массивом uint32.
+        Все слова обрабатываются сразу как одно длинное целое.
+        """
+        words = IEEE754Converter.as_words(buffer)
+        count = len(words)
+        packed = pack_lanes(words)
+        exponent_mask = (1 << IEEE754_EXPONENT_BITS) - 1
+        mantissa_mask = (1 << IEEE754_MANTISSA_BITS) - 1
 
-        result_mantissa &= ~(1 << IEEE754_MANTISSA_BITS)
+        sign = (packed >> (IEEE754_TOTAL_BITS - 1)) & repeat_lanes(1, _WORD_BYTES, count)
+        exponent = (packed >> IEEE754_MANTISSA_BITS) & repeat_lanes(exponent_mask, _WORD_BYTES, count)
+        mantissa = packed & repeat_lanes(mantissa_mask, _WORD_BYTES, count)
+        return (low_bytes(sign, _WORD_BYTES, count),
+                low_bytes(exponent, _WORD_BYTES, count),
+                unpack_lanes(mantissa, _WORD_TYPECODE, count))
 
-        if exponent >= 255:
-            raise OverflowError("Exponent Overflow.")
+    @staticmethod
+    def encode_fields(sign, exponent, mantissa):
+        """Обратная операция к decode_fields: собирает массив слов IEEE-754"""
+        return array(_WORD_TYPECODE, [
+            (s << (IEEE754_TOTAL_BITS - 1)) | (e << IEEE754_MANTISSA_BITS) | m
+            for s, e, m in zip(sign, exponent, mantissa)
+        ])
+
+    @staticmethod
+    def iter_fields(buffer, chunk_words=1 << 20):
+        """Разбирает буфер кусками по chunk_words слов — память не зависит от размера файла"""
+        words = IEEE754Converter.as_words(buffer)
+        for start in range(0, len(words), chunk_words):
+            yield IEEE754Converter.decode_fields(words[start:start + chunk_words])
 
-        result_binary = f"{0:01b}{format(exponent, f'0{IEEE754_EXPONENT_BITS}b')}{format(result_mantissa, f'0{IEEE754_MANTISSA_BITS}b')}"
+    @staticmethod
+    def bit_planes(buffer):
+        """Битовые плоскости: plane[k] — упакованные k-е биты всех слов.
+
+        Бит слова i лежит в байте i // 8 на позиции i % 8 (младший бит первым).
+        """
+        words = IEEE754Converter.as_words(buffer)
+        count = len(words)
+        raw = words.cast('B')
+        planes = []
+        for k in range(IEEE754_TOTAL_BITS):
+            byte_index = k // 8 if sys.byteorder == 'little' else _WORD_BYTES - 1 - k // 8
+            column = raw[byte_index::_WORD_BYTES].tobytes()
+            # Байт -> символ '0'/'1', затем одна строка разбирается как двоичное число
+            digits = column.translate(IEEE754Converter._bit_digit_table(k % 8))[::-1]
+            plane = int(digits, 2) if count else 0
+            planes.append(plane.to_bytes((count + 7) // 8, 'little'))
+        return planes
+
+    @staticmethod
+    def _bit_digit_table(bit):
+        return bytes(ord('1') if byte >> bit & 1 else ord('0') for byte in range(256))
+
+    @staticmethod
+    def sum_floats_ieee754(first_float, second_float, rounding=ROUND_NEAREST_EVEN):
+        soft = soft_float(BINARY32)
+        result_bits = soft.add(soft.from_float(first_float), soft.from_float(second_float), rounding)
+        result_binary = format(result_bits, f'0{IEEE754_TOTAL_BITS}b')
         result_float = IEEE754Converter.ieee754_to_float(result_binary)
 
         return result_float, result_binary
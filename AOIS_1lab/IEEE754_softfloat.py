@@ -0,0 +1,382 @@
+import math
+import operator
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from math import isqrt
+from constans import (BINARY32, BINARY64, ROUND_NEAREST_EVEN, ROUND_UP, ROUND_DOWN,
+                      ROUNDING_MODES)
+from B_lanes import pack_lanes, repeat_lanes, word_typecode
+
+
+def _native_div(a, b):
+    # float в Python бросает исключение при делении на ноль — такие слова пересчитываются программно
+    return a / b if b else math.nan
+
+
+def _native_sqrt(a):
+    return math.sqrt(a) if a >= 0 else math.nan
+
+
+@lru_cache(maxsize=None)
+def soft_float(float_format):
+    """Общий экземпляр SoftFloat для формата (параметры формата вычисляются один раз)"""
+    return SoftFloat(float_format)
+
+
+class SoftFloat:
+    """Программная модель арифметики IEEE-754 на целых числах.
+
+    Формат задаётся FloatFormat из constans (binary16, bfloat16, binary32, binary64).
+    Операнды и результаты — битовые комбинации (int). Точный результат операции
+    считается в длинных целых и округляется один раз по выбранному режиму,
+    поэтому знаки, денормализованные числа, бесконечности и NaN обрабатываются
+    так же, как в аппаратуре. Операции: add, sub, mul, div, sqrt, fma.
+    NaN-операнд возвращается «тихим» (первый по порядку), недопустимая операция
+    даёт канонический NaN.
+    """
+
+    def __init__(self, float_format=BINARY32):
+        self.format = float_format
+        self.total_bits = float_format.total_bits
+        self.exponent_bits = float_format.exponent_bits
+        self.mantissa_bits = float_format.mantissa_bits
+        self.bias = (1 << (self.exponent_bits - 1)) - 1
+        self.precision = self.mantissa_bits + 1
+        self.max_exponent = (1 << self.exponent_bits) - 1
+        self.min_exponent = 1 - self.bias
+        self.sign_mask = 1 << (self.total_bits - 1)
+        self.magnitude_mask = self.sign_mask - 1
+        self.mantissa_mask = (1 << self.mantissa_bits) - 1
+        self.quiet_bit = 1 << (self.mantissa_bits - 1)
+        self.infinity = self.max_exponent << self.mantissa_bits
+        self.default_nan = self.infinity | self.quiet_bit
+        self.max_finite = self.infinity - 1
+        self._typecode = float_format.array_code
+        self._word_typecode = word_typecode(self.total_bits)
+
+    def from_float(self, number, rounding=ROUND_NEAREST_EVEN):
+        """Python float (binary64) -> битовая комбинация формата"""
+        bits = int.from_bytes(struct.pack('!d', number), 'big')
+        if self.format == BINARY64:
+            return bits
+        return soft_float(BINARY64).convert(bits, self, rounding)
+
+    def to_float(self, bits):
+        if self.format != BINARY64:
+            # Расширение до binary64 всегда точное
+            bits = self.convert(bits, soft_float(BINARY64))
+        return struct.unpack('!d', bits.to_bytes(8, 'big'))[0]
+
+    def is_nan(self, bits):
+        return (bits & self.magnitude_mask) > self.infinity
+
+    def is_inf(self, bits):
+        return (bits & self.magnitude_mask) == self.infinity
+
+    def add(self, a, b, rounding=ROUND_NEAREST_EVEN):
+        return self._add(a, b, 0, rounding)
+
+    def sub(self, a, b, rounding=ROUND_NEAREST_EVEN):
+        return self._add(a, b, 1, rounding)
+
+    def mul(self, a, b, rounding=ROUND_NEAREST_EVEN):
+        return self._mul(a, b, rounding)
+
+    def div(self, a, b, rounding=ROUND_NEAREST_EVEN):
+        return self._div(a, b, rounding)
+
+    def sqrt(self, a, rounding=ROUND_NEAREST_EVEN):
+        return self._sqrt(a, rounding)
+
+    def fma(self, a, b, c, rounding=ROUND_NEAREST_EVEN):
+        """a * b + c с одним округлением"""
+        return self._fma(a, b, c, rounding)
+
+    def convert(self, bits, target, rounding=ROUND_NEAREST_EVEN):
+        """Переводит число из этого формата в формат target (экземпляр SoftFloat)"""
+        sign = bits >> (self.total_bits - 1)
+        magnitude = bits & self.magnitude_mask
+        target_sign = sign << (target.total_bits - 1)
+        if magnitude > self.infinity:
+            # Старшие биты полезной нагрузки NaN сохраняются, NaN становится «тихим»
+            payload = bits & self.mantissa_mask
+            shift = target.mantissa_bits - self.mantissa_bits
+            payload = payload << shift if shift >= 0 else payload >> -shift
+            return target_sign | target.infinity | target.quiet_bit | payload
+        if magnitude == self.infinity:
+            return target_sign | target.infinity
+        if magnitude == 0:
+            return target_sign
+        significand, exponent = self._unpack(bits)
+        return target._round_pack(sign, significand, exponent, rounding)
+
+    def add_batch(self, a_words, b_words, rounding=ROUND_NEAREST_EVEN):
+        """Сложение массивов слов (array, memoryview, любой буфер) поэлементно"""
+        return self._batch(self.add, operator.add, rounding, a_words, b_words)
+
+    def sub_batch(self, a_words, b_words, rounding=ROUND_NEAREST_EVEN):
+        return self._batch(self.sub, operator.sub, rounding, a_words, b_words)
+
+    def mul_batch(self, a_words, b_words, rounding=ROUND_NEAREST_EVEN):
+        return self._batch(self.mul, operator.mul, rounding, a_words, b_words)
+
+    def div_batch(self, a_words, b_words, rounding=ROUND_NEAREST_EVEN):
+        return self._batch(self.div, _native_div, rounding, a_words, b_words)
+
+    def sqrt_batch(self, words, rounding=ROUND_NEAREST_EVEN):
+        return self._batch(self.sqrt, _native_sqrt, rounding, words)
+
+    def fma_batch(self, a_words, b_words, c_words, rounding=ROUND_NEAREST_EVEN):
+        # Для fma двойное округление через double не безвредно — только программный путь
+        return self._batch(self.fma, None, rounding, a_words, b_words, c_words)
+
+    def convert_batch(self, words, target, rounding=ROUND_NEAREST_EVEN):
+        """Перевод массива слов в формат target"""
+        source = self._as_words(words)
+        if rounding == ROUND_NEAREST_EVEN and self._typecode and target._typecode:
+            # Приведение типов платформы: расширение точное, сужение — одно округление к ближайшему
+            result = array(target._typecode, source.cast('B').cast(self._typecode))
+            return target._fix_nan_lanes(result, lambda index: self.convert(source[index], target))
+        return array(target._word_typecode, [self.convert(bits, target, rounding) for bits in source])
+
+    def _add(self, a, b, negate_b, rounding):
+        self._check_rounding(rounding)
+        infinity = self.infinity
+        magnitude_a = a & self.magnitude_mask
+        magnitude_b = b & self.magnitude_mask
+        if magnitude_a > infinity or magnitude_b > infinity:
+            return self._propagate_nan(a, b)
+
+        sign_shift = self.total_bits - 1
+        sign_a = a >> sign_shift
+        sign_b = (b >> sign_shift) ^ negate_b
+        if magnitude_a == infinity or magnitude_b == infinity:
+            if magnitude_a == magnitude_b and sign_a != sign_b:
+                return self.default_nan
+            return a if magnitude_a == infinity else b ^ (negate_b << sign_shift)
+
+        significand_a, exponent_a = self._unpack(a)
+        significand_b, exponent_b = self._unpack(b)
+        return self._sum_exact(sign_a, significand_a, exponent_a, sign_b, significand_b, exponent_b, rounding)
+
+    def _sum_exact(self, sign_a, significand_a, exponent_a, sign_b, significand_b, exponent_b, rounding):
+        """Точная сумма двух конечных значений с одним округлением"""
+        # Оба слагаемых приводятся к меньшему порядку
+        if exponent_a >= exponent_b:
+            exponent = exponent_b
+            significand_a <<= exponent_a - exponent_b
+        else:
+            exponent = exponent_a
+            significand_b <<= exponent_b - exponent_a
+        total = (-significand_a if sign_a else significand_a) + (-significand_b if sign_b else significand_b)
+
+        sign_shift = self.total_bits - 1
+        if total == 0:
+            if sign_a == sign_b:
+                return sign_a << sign_shift
+            return int(rounding == ROUND_DOWN) << sign_shift
+        if total < 0:
+            return self._round_pack(1, -total, exponent, rounding)
+        return self._round_pack(0, total, exponent, rounding)
+
+    def _mul(self, a, b, rounding):
+        self._check_rounding(rounding)
+        if self.is_nan(a) or self.is_nan(b):
+            return self._propagate_nan(a, b)
+        sign_shift = self.total_bits - 1
+        sign = (a ^ b) >> sign_shift
+        magnitude_a, magnitude_b = a & self.magnitude_mask, b & self.magnitude_mask
+        if magnitude_a == self.infinity or magnitude_b == self.infinity:
+            if magnitude_a == 0 or magnitude_b == 0:
+                return self.default_nan
+            return (sign << sign_shift) | self.infinity
+        if magnitude_a == 0 or magnitude_b == 0:
+            return sign << sign_shift
+
+        significand_a, exponent_a = self._unpack(a)
+        significand_b, exponent_b = self._unpack(b)
+        # Произведение мантисс точное — округляется один раз
+        return self._round_pack(sign, significand_a * significand_b, exponent_a + exponent_b, rounding)
+
+    def _div(self, a, b, rounding):
+        self._check_rounding(rounding)
+        if self.is_nan(a) or self.is_nan(b):
+            return self._propagate_nan(a, b)
+        sign_shift = self.total_bits - 1
+        sign = (a ^ b) >> sign_shift
+        magnitude_a, magnitude_b = a & self.magnitude_mask, b & self.magnitude_mask
+        if magnitude_a == self.infinity:
+            return self.default_nan if magnitude_b == self.infinity else (sign << sign_shift) | self.infinity
+        if magnitude_b == self.infinity:
+            return sign << sign_shift
+        if magnitude_b == 0:
+            return self.default_nan if magnitude_a == 0 else (sign << sign_shift) | self.infinity
+        if magnitude_a == 0:
+            return sign << sign_shift
+
+        significand_a, exponent_a = self._unpack(a)
+        significand_b, exponent_b = self._unpack(b)
+        # Частное с запасом в два бита сверх точности формата; ненулевой остаток — «липкий» бит
+        shift = max(0, self.precision + 2 + significand_b.bit_length() - significand_a.bit_length())
+        quotient, remainder = divmod(significand_a << shift, significand_b)
+        significand = (quotient << 1) | (remainder != 0)
+        return self._round_pack(sign, significand, exponent_a - exponent_b - shift - 1, rounding)
+
+    def _sqrt(self, a, rounding):
+        self._check_rounding(rounding)
+        if self.is_nan(a):
+            return a | self.quiet_bit
+        magnitude = a & self.magnitude_mask
+        if magnitude == 0:
+            return a
+        if a >> (self.total_bits - 1):
+            return self.default_nan
+        if magnitude == self.infinity:
+            return a
+
+        significand, exponent = self._unpack(a)
+        if exponent & 1:
+            significand <<= 1
+            exponent -= 1
+        shift = max(0, self.precision + 2 - significand.bit_length() // 2)
+        scaled = significand << (2 * shift)
+        root = isqrt(scaled)
+        significand = (root << 1) | (root * root != scaled)
+        return self._round_pack(0, significand, exponent // 2 - shift - 1, rounding)
+
+    def _fma(self, a, b, c, rounding):
+        self._check_rounding(rounding)
+        if self.is_nan(a) or self.is_nan(b) or self.is_nan(c):
+            return next(x for x in (a, b, c) if self.is_nan(x)) | self.quiet_bit
+        sign_shift = self.total_bits - 1
+        sign_product = (a ^ b) >> sign_shift
+        sign_c = c >> sign_shift
+        magnitude_a, magnitude_b = a & self.magnitude_mask, b & self.magnitude_mask
+        magnitude_c = c & self.magnitude_mask
+        if magnitude_a == self.infinity or magnitude_b == self.infinity:
+            if magnitude_a == 0 or magnitude_b == 0:
+                return self.default_nan
+            if magnitude_c == self.infinity and sign_c != sign_product:
+                return self.default_nan
+            return (sign_product << sign_shift) | self.infinity
+        if magnitude_c == self.infinity:
+            return c
+
+        significand_a, exponent_a = self._unpack(a)
+        significand_b, exponent_b = self._unpack(b)
+        significand_c, exponent_c = self._unpack(c)
+        # a * b не округляется: точное произведение сразу складывается с c
+        return self._sum_exact(sign_product, significand_a * significand_b, exponent_a + exponent_b,
+                               sign_c, significand_c, exponent_c, rounding)
+
+    @staticmethod
+    def _check_rounding(rounding):
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Неизвестный режим округления: {rounding}")
+
+    def _unpack(self, bits):
+        """Конечное число -> (целая мантисса, порядок младшего бита)"""
+        exponent = (bits >> self.mantissa_bits) & self.max_exponent
+        fraction = bits & self.mantissa_mask
+        if exponent == 0:
+            return fraction, self.min_exponent - self.mantissa_bits
+        return fraction | (1 << self.mantissa_bits), exponent - self.bias - self.mantissa_bits
+
+    def _propagate_nan(self, a, b):
+        nan = a if self.is_nan(a) else b
+        return nan | self.quiet_bit
+
+    def _round_pack(self, sign, significand, exponent, rounding):
+        """Округляет точное значение (-1)^sign * significand * 2^exponent и упаковывает его"""
+        # Порядок младшего бита результата: precision значащих битов, но не ниже денормализованных
+        top_exponent = exponent + significand.bit_length() - 1
+        quantum = max(top_exponent, self.min_exponent) - self.mantissa_bits
+        shift = quantum - exponent
+
+        if shift <= 0:
+            mantissa = significand << -shift
+        else:
+            mantissa = significand >> shift
+            remainder = significand & ((1 << shift) - 1)
+            if remainder and self._round_up(sign, mantissa, remainder, shift, rounding):
+                mantissa += 1
+                if mantissa >> self.precision:
+                    mantissa >>= 1
+                    quantum += 1
+
+        if mantissa >> self.mantissa_bits:
+            biased = quantum + self.mantissa_bits + self.bias
+        else:
+            biased = 0
+        if biased >= self.max_exponent:
+            return self._overflow(sign, rounding)
+        return (sign << (self.total_bits - 1)) | (biased << self.mantissa_bits) | (mantissa & self.mantissa_mask)
+
+    @staticmethod
+    def _round_up(sign, mantissa, remainder, shift, rounding):
+        if rounding == ROUND_NEAREST_EVEN:
+            half = 1 << (shift - 1)
+            return remainder > half or (remainder == half and mantissa & 1)
+        if rounding == ROUND_UP:
+            return not sign
+        if rounding == ROUND_DOWN:
+            return bool(sign)
+        return False
+
+    def _overflow(self, sign, rounding):
+        to_infinity = (rounding == ROUND_NEAREST_EVEN
+                       or (rounding == ROUND_UP and not sign)
+                       or (rounding == ROUND_DOWN and sign))
+        return (sign << (self.total_bits - 1)) | (self.infinity if to_infinity else self.max_finite)
+
+    def _batch(self, scalar, native_op, rounding, *buffers):
+        """Поэлементное применение операции к массивам слов.
+
+        Для округления к ближайшему и форматов платформы (binary32, binary64) используется
+        арифметика float: для binary64 она и есть IEEE-754, а для binary32 двойное округление
+        через double безвредно (53 >= 2 * 24 + 2). Слова, где получился NaN, пересчитываются
+        программно — полезная нагрузка NaN не зависит от платформы.
+        """
+        operands = [self._as_words(buffer) for buffer in buffers]
+        if len(set(map(len, operands))) > 1:
+            raise ValueError("Массивы операндов должны быть одинаковой длины")
+
+        if rounding != ROUND_NEAREST_EVEN or native_op is None or self._typecode is None:
+            return array(self._word_typecode, [scalar(*words, rounding) for words in zip(*operands)])
+
+        floats = [words.cast('B').cast(self._typecode) for words in operands]
+        result = array(self._typecode, map(native_op, *floats))
+        return self._fix_nan_lanes(result, lambda index: scalar(*(words[index] for words in operands), rounding))
+
+    def _fix_nan_lanes(self, result, recompute):
+        words = memoryview(result).cast('B').cast(self._word_typecode)
+        for index in self._nan_indices(words):
+            words[index] = recompute(index)
+        return array(self._word_typecode, words.cast('B').tobytes())
+
+    def _as_words(self, buffer):
+        if isinstance(buffer, (list, tuple)):
+            return memoryview(array(self._word_typecode, buffer))
+        return memoryview(buffer).cast('B').cast(self._word_typecode)
+
+    def _nan_indices(self, words):
+        """Индексы NaN-слов: проверка сразу по всему массиву как по одному длинному целому"""
+        count = len(words)
+        width = self.total_bits // 8
+        order = sys.byteorder
+        packed = pack_lanes(words)
+        magnitude = packed & repeat_lanes(self.magnitude_mask, width, count)
+        # |x| > inf  <=>  |x| + (2^(n-1) - 1 - inf) переносит единицу в знаковый разряд слова
+        flags = (magnitude + repeat_lanes(self.sign_mask - 1 - self.infinity, width, count)) \
+            & repeat_lanes(self.sign_mask, width, count)
+        if not flags:
+            return
+        raw = (flags >> (self.total_bits - 1)).to_bytes(count * width, order)
+        offset = 0 if order == 'little' else width - 1
+        position = raw.find(1, offset)
+        while position != -1:
+            if (position - offset) % width == 0:
+                yield (position - offset) // width
+            position = raw.find(1, position + 1)
@@ -1,4 +1,5 @@
-import Tests
+import unittest
+from array import array
 from IEEE754_converter import IEEE754Converter
 
 class TestIEEE754Converter(unittest.TestCase):
@@ -16,3 +17,33 @@ class TestIEEE754Converter(unittest.TestCase):
         result_float, result_binary = IEEE754Converter.sum_floats_ieee754(5.75, 2.25)
         self.assertEqual(result_float, 8.0)
         self.assertEqual(result_binary, '01000001000000000000000000000000')
+
+    def test_as_words_is_zero_copy(self):
+        floats = array('f', [5.75, -2.25])
+        words = IEEE754Converter.as_words(floats)
+        self.assertEqual(words[0], 0b01000000101110000000000000000000)
+        floats[0] = 1.0
+        self.assertEqual(words[0], 0x3F800000)
+
+    def test_decode_fields(self):
+        sign, exponent, mantissa = IEEE754Converter.decode_fields(array('f', [5.75, -2.25, 0.0]))
+        self.assertEqual(list(sign), [0, 1, 0])
+        self.assertEqual(list(exponent), [129, 128, 0])
+        self.assertEqual(list(mantissa), [0b01110000000000000000000, 0b00100000000000000000000, 0])
+        words = IEEE754Converter.encode_fields(sign, exponent, mantissa)
+        self.assertEqual(list(IEEE754Converter.words_to_floats(words)), [5.75, -2.25, 0.0])
+
+    def test_iter_fields_in_chunks(self):
+        data = array('f', range(10)).tobytes()
+        chunks = list(IEEE754Converter.iter_fields(data, chunk_words=4))
+        self.assertEqual([len(chunk[0]) for chunk in chunks], [4, 4, 2])
+
+    def test_bit_planes(self):
+        planes = IEEE754Converter.bit_planes(array('f', [5.75, -2.25, 1.0]))
+        self.assertEqual(len(planes), 32)
+        self.assertEqual(planes[31], bytes([0b010]))
+        self.assertEqual(planes[23], bytes([0b101]))
+
+    def test_unaligned_buffer(self):
+        with self.assertRaises(ValueError):
+            IEEE754Converter.as_words(b'abc')
@@ -0,0 +1,46 @@
+import unittest
+from itertools import islice
+from types import GeneratorType
+from B_arithmetic import ShiftAddMultiplier, BoothMultiplier, NonRestoringDivider, LongDivider
+
+
+class TestArithmeticEngines(unittest.TestCase):
+
+    def test_shift_add_multiplier(self):
+        self.assertEqual(ShiftAddMultiplier(3, 4).result(), 12)
+        self.assertEqual(ShiftAddMultiplier(-7, 5).result(), -35)
+        self.assertEqual(len(list(ShiftAddMultiplier(3, 4, 8).steps())), 8)
+
+    def test_booth_multiplier(self):
+        for n1, n2 in [(3, 4), (-128, -128), (127, -128), (-1, 1), (0, -5)]:
+            self.assertEqual(BoothMultiplier(n1, n2, 8).result(), n1 * n2)
+        digits = [step.digit for step in BoothMultiplier(3, -4, 8).steps()]
+        self.assertEqual(digits, [0, -1, 0, 0])
+
+    def test_non_restoring_divider(self):
+        quotient, remainder = NonRestoringDivider(7, 3, 5).result()
+        self.assertEqual(quotient, 0b1001010)
+        self.assertEqual(remainder, (7 << 5) % 3)
+
+    def test_divider_high_precision(self):
+        quotient, _ = NonRestoringDivider(1, 3, 400).result()
+        self.assertEqual(quotient, (1 << 400) // 3)
+
+    def test_steps_are_lazy(self):
+        steps = NonRestoringDivider(1, 3, 10 ** 6).steps()
+        self.assertIsInstance(steps, GeneratorType)
+        self.assertEqual(next(steps).cycle, 1)
+
+    def test_divide_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            NonRestoringDivider(1, 0)
+
+    def test_long_divider(self):
+        divider = LongDivider(-22, 7)
+        self.assertTrue(divider.negative)
+        self.assertEqual(divider.integer_part, 3)
+        # 1/7 = 0.(001)
+        self.assertEqual(list(islice(divider.bits(chunk_bits=4), 9)), [0, 0, 1] * 3)
+        fraction, remainder = LongDivider(1, 3).fraction(10_000)
+        self.assertEqual(fraction, (4 ** 5000 - 1) // 3)
+        self.assertEqual(remainder, 1)
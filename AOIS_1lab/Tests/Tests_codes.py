@@ -0,0 +1,45 @@
+import unittest
+from array import array
+from constans import BCD_8421, BCD_2421, EXCESS_3, GRAY_BCD
+from B_codes import CodeConverter
+
+class TestCodeConverter(unittest.TestCase):
+
+    def test_encode_decode(self):
+        self.assertEqual(CodeConverter.encode(59, BCD_8421), '01011001')
+        self.assertEqual(CodeConverter.encode(59, BCD_2421), '10111111')
+        self.assertEqual(CodeConverter.encode(59, EXCESS_3), '10001100')
+        self.assertEqual(CodeConverter.encode(59, GRAY_BCD), '01111101')
+        self.assertEqual(CodeConverter.decode('10111111', BCD_2421), 59)
+        with self.assertRaises(ValueError):
+            CodeConverter.decode('1010', BCD_8421)
+
+    def test_gray(self):
+        self.assertEqual(CodeConverter.gray_encode(5, 4), '0111')
+        self.assertEqual(CodeConverter.gray_decode('0111'), 5)
+        values = array('H', [0, 1, 2, 0x8000, 0xFFFF])
+        codes = CodeConverter.gray_encode_batch(values, 16)
+        self.assertEqual(list(codes), [v ^ (v >> 1) for v in values])
+        self.assertEqual(list(CodeConverter.gray_decode_batch(codes, 16)), list(values))
+
+    def test_batch(self):
+        tetrads = CodeConverter.encode_batch(bytes(range(10)), BCD_2421)
+        self.assertEqual(CodeConverter.decode_batch(tetrads, BCD_2421), bytes(range(10)))
+        self.assertEqual(CodeConverter.transcode_batch(tetrads, BCD_2421, EXCESS_3), bytes(range(3, 13)))
+        with self.assertRaises(ValueError):
+            CodeConverter.decode_batch(b'\x05\x0a', BCD_8421)
+
+    def test_numbers_batch(self):
+        data = CodeConverter.encode_numbers_batch([1995, 7], 3, packed=True)
+        self.assertEqual(data, bytes.fromhex('19950007'))
+        self.assertEqual(list(CodeConverter.decode_numbers_batch(data, 3, packed=True)), [1995, 7])
+        data = CodeConverter.encode_numbers_batch([42], 2, EXCESS_3)
+        self.assertEqual(data, b'\x07\x05')
+
+    def test_truth_table(self):
+        table = CodeConverter.truth_table(BCD_8421, BCD_8421, lambda digit: (digit + 5) % 10)
+        self.assertEqual(table[9], [1, 0, 0, 1, 0, 1, 0, 0])
+        self.assertEqual(table[12], [1, 1, 0, 0, 0, 0, 0, 0])
+        table = CodeConverter.truth_table(BCD_2421, EXCESS_3, fill=None)
+        self.assertEqual(table[11], [1, 0, 1, 1, 1, 0, 0, 0])
+        self.assertEqual(table[5][4:], [None] * 4)
@@ -1,4 +1,7 @@
-import Tests
+import unittest
+from array import array
+from decimal import Decimal
+from fractions import Fraction
 from B_converter import BinaryConverter
 
 class TestBinaryConverter(unittest.TestCase):
@@ -17,3 +20,46 @@ class TestBinaryConverter(unittest.TestCase):
     def test_bin_to_dec(self):
         result = BinaryConverter.bin_to_dec('101.101')
         self.assertEqual(result, 5.625)
+
+    def test_dec_to_bin_batch(self):
+        numbers = [5, -5, 0, -128, 127]
+        direct, inverse, complement = BinaryConverter.dec_to_bin_batch(numbers, 8)
+        for i, n in enumerate(numbers):
+            expected = BinaryConverter.dec_to_bin(n, 8)
+            self.assertEqual(format(direct[i], '08b'), expected[0])
+            self.assertEqual(format(inverse[i], '08b'), expected[1])
+        self.assertEqual(list(complement), [5, 251, 0, 128, 127])
+
+    def test_dec_to_bin_batch_buffer(self):
+        numbers = array('i', [5, -5, -(2 ** 31)])
+        direct, inverse, complement = BinaryConverter.dec_to_bin_batch(numbers, 32)
+        self.assertEqual(list(direct), [5, 0x80000005, 0x80000000])
+        self.assertEqual(list(inverse), [5, 0xFFFFFFFA, 0xFFFFFFFF])
+        self.assertEqual(list(complement), [5, 0xFFFFFFFB, 0x80000000])
+
+        direct, _, _ = BinaryConverter.dec_to_bin_batch(numbers, 32, packed=True)
+        self.assertEqual(direct[4:8], b'\x80\x00\x00\x05')
+
+    def test_dec_to_bin_batch_range(self):
+        with self.assertRaises(ValueError):
+            BinaryConverter.dec_to_bin_batch([1, 200], 8)
+
+    def test_dec_to_bin_tables(self):
+        direct, inverse, complement = BinaryConverter.dec_to_bin(-300, 16)
+        self.assertEqual(direct, '1000000100101100')
+        self.assertEqual(inverse, '1111111011010011')
+        self.assertEqual(complement, '1111111011010100')
+        self.assertEqual(BinaryConverter.dec_to_bin(-128, 8), ('10000000', '11111111', '10000000'))
+        # Ширина без таблицы считается напрямую и даёт те же коды
+        self.assertEqual(BinaryConverter.dec_to_bin(-5, 12)[2], '111111111011')
+        with self.assertRaises(ValueError):
+            BinaryConverter.dec_to_bin(128, 8)
+
+    def test_bin_to_dec_exact(self):
+        self.assertEqual(BinaryConverter.bin_to_dec('-101.101', Fraction), Fraction(-45, 8))
+        # 2^-100 ровно: 100 десятичных знаков, без округления до точности контекста
+        value = BinaryConverter.bin_to_dec('0.' + '0' * 99 + '1', Decimal)
+        self.assertEqual(value, Decimal(f'{5 ** 100}E-100'))
+        self.assertEqual(Fraction(value), Fraction(1, 2 ** 100))
+        negative = BinaryConverter.bin_to_dec('-0.' + '0' * 99 + '1', Decimal)
+        self.assertEqual(negative, Decimal(f'-{5 ** 100}E-100'))
@@ -0,0 +1,34 @@
+import io
+import unittest
+from constans import BINARY32
+from main import convert_stream, read_numbers
+
+class TestBatchConverter(unittest.TestCase):
+
+    def test_read_numbers_chunks(self):
+        stream = io.StringIO('1 2,3\n-4 5')
+        self.assertEqual(list(read_numbers(stream, int, 2)), [[1, 2], [3, -4], [5]])
+
+    def test_convert_stream_csv(self):
+        sink = io.StringIO()
+        count = convert_stream(io.StringIO('5\n-5\n'), sink, output_format='csv')
+        self.assertEqual(count, 2)
+        self.assertEqual(sink.getvalue().splitlines()[2], '-5,10000101,11111010,11111011')
+
+    def test_convert_stream_binary(self):
+        sink = io.BytesIO()
+        convert_stream(io.StringIO('-300'), sink, bits=16, output_format='binary')
+        self.assertEqual(sink.getvalue(), bytes.fromhex('812c fed3 fed4'))
+
+        sink = io.BytesIO()
+        convert_stream(io.StringIO('1.5'), sink, kind='float', float_format=BINARY32, output_format='binary')
+        self.assertEqual(sink.getvalue(), bytes.fromhex('3fc00000'))
+
+        # Без формата — binary32, как у подкоманды batch
+        sink = io.BytesIO()
+        convert_stream(io.StringIO('1.5'), sink, kind='float', output_format='binary')
+        self.assertEqual(sink.getvalue(), bytes.fromhex('3fc00000'))
+
+    def test_convert_stream_range(self):
+        with self.assertRaises(ValueError):
+            convert_stream(io.StringIO('1 200'), io.StringIO())
@@ -1,4 +1,4 @@
-import Tests
+import unittest
 from B_operation import BinaryOperations
 
 
@@ -35,3 +35,37 @@ class TestBinaryOperations(unittest.TestCase):
         result_bin, result_dec = BinaryOperations.divide_direct(7, 0)
         self.assertEqual(result_bin, "Ошибка: деление на ноль")
         self.assertIsNone(result_dec)
+
+    def test_add_complement_batch(self):
+        result = BinaryOperations.add_complement_batch([5, -5, 127, -1], [3, 3, 1, 1])
+        self.assertEqual(list(result.codes), [0b00001000, 0b11111110, 0b10000000, 0])
+        self.assertEqual(list(result.carry), [0, 0, 0, 1])
+        self.assertEqual(list(result.overflow), [0, 0, 1, 0])
+        self.assertEqual(list(result.zero), [0, 0, 0, 1])
+        self.assertEqual(list(result.sign), [0, 1, 1, 0])
+
+    def test_subtract_complement_batch(self):
+        result = BinaryOperations.subtract_complement_batch([5, 5, -128], [3, -3, 1], 32)
+        self.assertEqual(list(result.codes), [2, 8, 0xFFFFFF7F])
+        self.assertEqual(list(result.overflow), [0, 0, 0])
+
+        result = BinaryOperations.subtract_complement_batch([-128], [1], 8)
+        self.assertEqual(list(result.codes), [0b01111111])
+        self.assertEqual(list(result.overflow), [1])
+
+    def test_divide_direct_negative(self):
+        result_bin, result_dec = BinaryOperations.divide_direct(-7, 3)
+        self.assertEqual(result_bin, '-00000010.01010')
+        self.assertAlmostEqual(result_dec, -2.3125, places=5)
+
+    def test_byte_alu_tables(self):
+        self.assertEqual(BinaryOperations.add_complement(127, 1), ('10000000', -128))
+        self.assertEqual(BinaryOperations.subtract_complement(-1, -128), ('01111111', 127))
+        self.assertEqual(BinaryOperations.subtract_complement(3, -128, 16), ('0000000010000011', 131))
+        with self.assertRaises(ValueError):
+            BinaryOperations.add_complement(200, 1)
+
+    def test_divide_direct_long_precision(self):
+        result_bin, result_dec = BinaryOperations.divide_direct(1, 3, 8, precision=200)
+        self.assertEqual(result_bin, '00000000.' + '01' * 100)
+        self.assertEqual(result_dec, 1 / 3)
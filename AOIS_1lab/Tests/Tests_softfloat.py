@@ -0,0 +1,149 @@
+import unittest
+from array import array
+from IEEE754_softfloat import SoftFloat, soft_float
+from constans import (ROUND_NEAREST_EVEN, ROUND_TOWARD_ZERO, ROUND_UP, ROUND_DOWN,
+                      BINARY16, BFLOAT16, BINARY32, BINARY64, FLOAT_FORMATS)
+
+
+class TestSoftFloatAdd(unittest.TestCase):
+
+    def setUp(self):
+        self.sf = SoftFloat()
+
+    def bits(self, number):
+        return self.sf.from_float(number)
+
+    def test_add_with_signs(self):
+        self.assertEqual(self.sf.add(self.bits(5.75), self.bits(-2.25)), self.bits(3.5))
+        self.assertEqual(self.sf.sub(self.bits(-1.5), self.bits(2.5)), self.bits(-4.0))
+
+    def test_rounding_modes(self):
+        one, tiny = self.bits(1.0), self.bits(2.0 ** -30)
+        self.assertEqual(self.sf.add(one, tiny, ROUND_NEAREST_EVEN), one)
+        self.assertEqual(self.sf.add(one, tiny, ROUND_TOWARD_ZERO), one)
+        self.assertEqual(self.sf.add(one, tiny, ROUND_UP), one + 1)
+        self.assertEqual(self.sf.sub(one, tiny, ROUND_DOWN), 0x3F7FFFFF)
+
+    def test_ties_to_even(self):
+        # 1 + 2^-24 ровно посередине между 1 и 1 + 2^-23
+        self.assertEqual(self.sf.add(self.bits(1.0), self.bits(2.0 ** -24)), self.bits(1.0))
+        self.assertEqual(self.sf.add(0x3F800001, self.bits(2.0 ** -24)), 0x3F800002)
+
+    def test_subnormals(self):
+        smallest = 0x00000001
+        self.assertEqual(self.sf.add(smallest, smallest), 0x00000002)
+        self.assertEqual(self.sf.add(0x007FFFFF, smallest), 0x00800000)
+        self.assertEqual(self.sf.sub(0x00800000, smallest), 0x007FFFFF)
+
+    def test_zero_signs(self):
+        self.assertEqual(self.sf.sub(self.bits(1.0), self.bits(1.0)), 0)
+        self.assertEqual(self.sf.sub(self.bits(1.0), self.bits(1.0), ROUND_DOWN), 0x80000000)
+        self.assertEqual(self.sf.add(0x80000000, 0x80000000), 0x80000000)
+
+    def test_special_values(self):
+        inf, max_finite = 0x7F800000, 0x7F7FFFFF
+        self.assertEqual(self.sf.add(inf, self.bits(1.0)), inf)
+        self.assertTrue(self.sf.is_nan(self.sf.sub(inf, inf)))
+        self.assertEqual(self.sf.add(0x7FA00001, self.bits(1.0)), 0x7FE00001)
+        self.assertEqual(self.sf.add(max_finite, max_finite), inf)
+        self.assertEqual(self.sf.add(max_finite, max_finite, ROUND_TOWARD_ZERO), max_finite)
+
+    def test_batch_matches_scalar(self):
+        numbers = [1.5, -2.25, 3.0e38, 1.0e-45, 0.0, float('inf'), float('nan')]
+        first = array('f', numbers)
+        second = array('f', reversed(numbers))
+        for rounding in (ROUND_NEAREST_EVEN, ROUND_DOWN):
+            result = self.sf.add_batch(first, second, rounding)
+            words_a, words_b = memoryview(first).cast('B').cast('I'), memoryview(second).cast('B').cast('I')
+            expected = [self.sf.add(a, b, rounding) for a, b in zip(words_a, words_b)]
+            self.assertEqual(list(result), expected)
+
+
+class TestFloatFormats(unittest.TestCase):
+
+    def test_format_parameters(self):
+        half = soft_float(BINARY16)
+        self.assertEqual(half.bias, 15)
+        self.assertEqual(half.infinity, 0x7C00)
+        self.assertEqual(soft_float(BFLOAT16).infinity, 0x7F80)
+        self.assertEqual(soft_float(BINARY64).default_nan, 0x7FF8000000000000)
+
+    def test_round_trip(self):
+        for float_format in FLOAT_FORMATS:
+            soft = soft_float(float_format)
+            for number in (1.0, -2.5, 0.0, 65504.0 if float_format == BINARY16 else 2.0 ** 100):
+                self.assertEqual(soft.to_float(soft.from_float(number)), number)
+
+    def test_add_half_and_bfloat(self):
+        half = soft_float(BINARY16)
+        self.assertEqual(half.add(half.from_float(65504.0), half.from_float(32.0)), 0x7C00)
+        self.assertEqual(half.add(0x0001, 0x0001), 0x0002)
+        bfloat = soft_float(BFLOAT16)
+        self.assertEqual(bfloat.add(bfloat.from_float(1.0), bfloat.from_float(2.0 ** -8)), bfloat.from_float(1.0))
+        self.assertEqual(bfloat.add(bfloat.from_float(1.0), bfloat.from_float(2.0 ** -8), ROUND_UP), 0x3F81)
+
+    def test_convert(self):
+        single, half = soft_float(BINARY32), soft_float(BINARY16)
+        self.assertEqual(single.convert(single.from_float(1.0e5), half), 0x7C00)
+        self.assertEqual(single.convert(single.from_float(1.0e5), half, ROUND_TOWARD_ZERO), 0x7BFF)
+        self.assertEqual(half.convert(0x7E01, single), 0x7FC02000)
+        self.assertEqual(single.convert(1, half), 0)
+
+    def test_convert_batch(self):
+        single, double = soft_float(BINARY32), soft_float(BINARY64)
+        words = array('d', [0.1, -1.0e300, 3.0, float('nan')])
+        result = double.convert_batch(words, single)
+        expected = [double.convert(bits, single) for bits in memoryview(words).cast('B').cast('Q')]
+        self.assertEqual(list(result), expected)
+        self.assertEqual(result[1], 0xFF800000)
+
+
+class TestSoftFloatMulDivSqrtFma(unittest.TestCase):
+
+    def setUp(self):
+        self.sf = soft_float(BINARY32)
+
+    def bits(self, number):
+        return self.sf.from_float(number)
+
+    def test_mul(self):
+        self.assertEqual(self.sf.mul(self.bits(1.5), self.bits(-2.0)), self.bits(-3.0))
+        self.assertEqual(self.sf.mul(self.bits(2.0 ** -100), self.bits(2.0 ** -100)), 0)
+        self.assertEqual(self.sf.mul(self.bits(2.0 ** -100), self.bits(2.0 ** -100), ROUND_UP), 1)
+        self.assertTrue(self.sf.is_nan(self.sf.mul(0x7F800000, 0)))
+
+    def test_div(self):
+        self.assertEqual(self.sf.div(self.bits(1.0), self.bits(3.0)), 0x3EAAAAAB)
+        self.assertEqual(self.sf.div(self.bits(1.0), self.bits(3.0), ROUND_TOWARD_ZERO), 0x3EAAAAAA)
+        self.assertEqual(self.sf.div(self.bits(-1.0), 0), 0xFF800000)
+        self.assertTrue(self.sf.is_nan(self.sf.div(0, 0)))
+
+    def test_sqrt(self):
+        self.assertEqual(self.sf.sqrt(self.bits(2.0)), 0x3FB504F3)
+        self.assertEqual(self.sf.sqrt(self.bits(2.0), ROUND_UP), 0x3FB504F4)
+        self.assertEqual(self.sf.sqrt(0x80000000), 0x80000000)
+        self.assertTrue(self.sf.is_nan(self.sf.sqrt(self.bits(-1.0))))
+        self.assertEqual(self.sf.sqrt(1), self.bits(2.0 ** -74.5))
+
+    def test_fma_single_rounding(self):
+        a = self.bits(1.0 + 2.0 ** -12)
+        c = self.bits(-(1.0 + 2.0 ** -11))
+        # a * a + c = 2^-24 точно; раздельные mul и add дали бы 0
+        self.assertEqual(self.sf.fma(a, a, c), self.bits(2.0 ** -24))
+        self.assertEqual(self.sf.add(self.sf.mul(a, a), c), 0)
+
+    def test_batches_match_scalar(self):
+        numbers = [1.5, -2.25, 3.0e38, 1.0e-45, 0.0, -0.0, float('inf'), float('nan'), 9.0]
+        first = array('f', numbers)
+        second = array('f', reversed(numbers))
+        words_a = list(memoryview(first).cast('B').cast('I'))
+        words_b = list(memoryview(second).cast('B').cast('I'))
+        for rounding in (ROUND_NEAREST_EVEN, ROUND_DOWN):
+            self.assertEqual(list(self.sf.mul_batch(first, second, rounding)),
+                             [self.sf.mul(a, b, rounding) for a, b in zip(words_a, words_b)])
+            self.assertEqual(list(self.sf.div_batch(first, second, rounding)),
+                             [self.sf.div(a, b, rounding) for a, b in zip(words_a, words_b)])
+            self.assertEqual(list(self.sf.sqrt_batch(first, rounding)),
+                             [self.sf.sqrt(a, rounding) for a in words_a])
+            self.assertEqual(list(self.sf.fma_batch(first, second, first, rounding)),
+                             [self.sf.fma(a, b, a, rounding) for a, b in zip(words_a, words_b)])
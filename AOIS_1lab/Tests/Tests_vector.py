@@ -0,0 +1,33 @@
+import unittest
+from B_vector import BitVector
+
+
+class TestBitVector(unittest.TestCase):
+
+    def test_codes(self):
+        code = BitVector.from_signed(-5, 8)
+        self.assertEqual(code.direct().to_str(), '10000101')
+        self.assertEqual(code.inverse().to_str(), '11111010')
+        self.assertEqual(code.complement().to_str(), '11111011')
+        self.assertEqual(code.to_signed(), -5)
+
+    def test_wide_vectors(self):
+        for width in (64, 128, 4096):
+            code = BitVector.from_signed(-1, width)
+            self.assertEqual(code.to_str(), '1' * width)
+            self.assertEqual(code.direct().to_str(), '1' + '0' * (width - 2) + '1')
+            self.assertEqual(code.increment().to_str(), '0' * width)
+
+    def test_add_wraps_around(self):
+        result = BitVector.from_signed(127, 8) + BitVector.from_signed(1, 8)
+        self.assertEqual(result.to_str(), '10000000')
+        self.assertEqual(result.to_signed(), -128)
+
+    def test_from_str(self):
+        code = BitVector.from_str('00001010')
+        self.assertEqual(code, BitVector(10, 8))
+        self.assertEqual(len(code), 8)
+
+    def test_range(self):
+        with self.assertRaises(ValueError):
+            BitVector.from_signed(128, 8)
@@ -1,3 +1,4 @@
+from collections import namedtuple
 
 BITS_DEFAULT = 8
 BITS_IEEE754 = 32
@@ -5,3 +6,29 @@ EXPONENT_BIAS = 127
 IEEE754_TOTAL_BITS = 32
 IEEE754_EXPONENT_BITS = 8
 IEEE754_MANTISSA_BITS = 23
+
+# Разрядности, для которых коды берутся из таблиц (строятся при первом обращении)
+TABLE_WIDTHS = (8, 16)
+
+# Режимы округления IEEE-754
+ROUND_NEAREST_EVEN = 'nearest_even'
+ROUND_TOWARD_ZERO = 'toward_zero'
+ROUND_UP = 'up'        # к +бесконечности
+ROUND_DOWN = 'down'    # к -бесконечности
+ROUNDING_MODES = (ROUND_NEAREST_EVEN, ROUND_TOWARD_ZERO, ROUND_UP, ROUND_DOWN)
+
+# Форматы IEEE-754: array_code — код типа array для форматов, которые умеет платформа
+FloatFormat = namedtuple('FloatFormat', ['name', 'total_bits', 'exponent_bits', 'mantissa_bits', 'array_code'])
+BINARY16 = FloatFormat('binary16', 16, 5, 10, None)
+BFLOAT16 = FloatFormat('bfloat16', 16, 8, 7, None)
+BINARY32 = FloatFormat('binary32', IEEE754_TOTAL_BITS, IEEE754_EXPONENT_BITS, IEEE754_MANTISSA_BITS, 'f')
+BINARY64 = FloatFormat('binary64', 64, 11, 52, 'd')
+FLOAT_FORMATS = (BINARY16, BFLOAT16, BINARY32, BINARY64)
+
+# Двоично-десятичные коды: tetrads[d] — тетрада, которой кодируется цифра d
+DecimalCode = namedtuple('DecimalCode', ['name', 'tetrads'])
+BCD_8421 = DecimalCode('8421', tuple(range(10)))
+BCD_2421 = DecimalCode('2421', (0, 1, 2, 3, 4, 11, 12, 13, 14, 15))
+EXCESS_3 = DecimalCode('excess-3', tuple(d + 3 for d in range(10)))
+GRAY_BCD = DecimalCode('gray', tuple(d ^ (d >> 1) for d in range(10)))
+DECIMAL_CODES = (BCD_8421, BCD_2421, EXCESS_3, GRAY_BCD)
@@ -1,8 +1,164 @@
+import argparse
+import sys
+import time
+from array import array
+from constans import BINARY32, BINARY64, BITS_DEFAULT, FLOAT_FORMATS, TABLE_WIDTHS
 from B_converter import BinaryConverter
 from B_operation import BinaryOperations
 from IEEE754_converter import IEEE754Converter
+from IEEE754_softfloat import soft_float
 
-def main():
+# Вход читается блоками по столько символов, числа конвертируются порциями по CHUNK_SIZE
+READ_BLOCK = 1 << 16
+CHUNK_SIZE = 1 << 16
+OUTPUT_FORMATS = ('text', 'csv', 'binary')
+
+
+def read_numbers(stream, parse, chunk_size=CHUNK_SIZE):
+    """Читает числа, разделённые пробелами, переводами строк или запятыми, порциями по chunk_size.
+
+    В памяти одновременно находятся только один блок текста и одна порция чисел.
+    """
+    chunk = []
+    tail = ''
+    while True:
+        block = stream.read(READ_BLOCK)
+        if not block:
+            break
+        tokens = (tail + block).replace(',', ' ').split()
+        # Последний токен может продолжаться в следующем блоке
+        tail = tokens.pop() if tokens and not block[-1].isspace() and block[-1] != ',' else ''
+        chunk.extend(map(parse, tokens))
+        while len(chunk) >= chunk_size:
+            yield chunk[:chunk_size]
+            del chunk[:chunk_size]
+    if tail:
+        chunk.append(parse(tail))
+    if chunk:
+        yield chunk
+
+
+def _interleave(blocks, width):
+    """Склеивает упакованные коды в записи: i-й код каждого блока подряд"""
+    stride = width * len(blocks)
+    record = bytearray(len(blocks[0]) * len(blocks))
+    for position, block in enumerate(blocks):
+        for byte in range(width):
+            record[position * width + byte::stride] = block[byte::width]
+    return record
+
+
+def _code_strings(codes, bits):
+    if bits in TABLE_WIDTHS:
+        return map(BinaryConverter.bit_strings(bits).__getitem__, codes)
+    fmt = f'0{bits}b'
+    return (format(code, fmt) for code in codes)
+
+
+def _write_int_chunk(sink, numbers, bits, output_format):
+    if output_format == 'binary':
+        # Запись на число: прямой, обратный и дополнительный коды, старший байт первым
+        blocks = BinaryConverter.dec_to_bin_batch(numbers, bits, packed=True)
+        sink.write(_interleave(blocks, (bits + 7) // 8))
+        return
+    codes = [_code_strings(block, bits) for block in BinaryConverter.dec_to_bin_batch(numbers, bits)]
+    if output_format == 'csv':
+        rows = map('{},{},{},{}'.format, numbers, *codes)
+    else:
+        rows = map('{} {} {}'.format, *codes)
+    sink.write('\n'.join(rows) + '\n')
+
+
+def _write_float_chunk(sink, numbers, float_format, output_format):
+    target = soft_float(float_format)
+    words = soft_float(BINARY64).convert_batch(array('d', numbers), target)
+    if output_format == 'binary':
+        if sys.byteorder == 'little':
+            words.byteswap()
+        sink.write(words.tobytes())
+        return
+    strings = [format(word, f'0{target.total_bits}b') for word in words]
+    if output_format == 'csv':
+        exponent_end = 1 + target.exponent_bits
+        rows = (f'{number},{bits[0]},{bits[1:exponent_end]},{bits[exponent_end:]}'
+                for number, bits in zip(numbers, strings))
+    else:
+        rows = strings
+    sink.write('\n'.join(rows) + '\n')
+
+
+def convert_stream(source, sink, kind='int', bits=BITS_DEFAULT, float_format=BINARY32,
+                   output_format='text', chunk_size=CHUNK_SIZE):
+    """Потоковый перевод чисел из source в sink, возвращает количество обработанных чисел.
+
+    Для binary sink должен быть бинарным потоком, для text и csv — текстовым.
+    """
+    if output_format == 'csv':
+        header = 'number,direct,inverse,complement' if kind == 'int' else 'number,sign,exponent,mantissa'
+        sink.write(header + '\n')
+    count = 0
+    for numbers in read_numbers(source, int if kind == 'int' else float, chunk_size):
+        if kind == 'int':
+            _write_int_chunk(sink, numbers, bits, output_format)
+        else:
+            _write_float_chunk(sink, numbers, float_format, output_format)
+        count += len(numbers)
+    return count
+
+
+def _open_output(path, output_format):
+    if output_format == 'binary':
+        return open(path, 'wb') if path else sys.stdout.buffer
+    return open(path, 'w', encoding='utf-8', newline='') if path else sys.stdout
+
+
+def run_batch(args):
+    formats = {float_format.name: float_format for float_format in FLOAT_FORMATS}
+    source = open(args.input, encoding='utf-8') if args.input != '-' else sys.stdin
+    sink = _open_output(args.output, args.format)
+    start = time.perf_counter()
+    try:
+        count = convert_stream(source, sink, args.type, args.bits, formats[args.float_format],
+                               args.format, args.chunk)
+    except ValueError as error:
+        print(f"Ошибка: {error}", file=sys.stderr)
+        return 1
+    finally:
+        sink.flush()
+        if source is not sys.stdin:
+            source.close()
+        if args.output:
+            sink.close()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else float('inf')
+    print(f"Обработано чисел: {count} за {elapsed:.3f} с ({rate:,.0f} чисел/с)", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Перевод чисел в двоичные коды и IEEE-754")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    batch = subparsers.add_parser('batch', help="потоковый перевод чисел из файла или stdin")
+    batch.add_argument('input', nargs='?', default='-', help="входной файл ('-' — stdin)")
+    batch.add_argument('-o', '--output', help="выходной файл (по умолчанию stdout)")
+    batch.add_argument('-t', '--type', choices=('int', 'float'), default='int')
+    batch.add_argument('-b', '--bits', type=int, default=BITS_DEFAULT, help="разрядность целых чисел")
+    batch.add_argument('--float-format', choices=[f.name for f in FLOAT_FORMATS], default='binary32')
+    batch.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='text')
+    batch.add_argument('--chunk', type=int, default=CHUNK_SIZE, help="чисел в одной порции")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        interactive()
+        return 0
+    args = build_parser().parse_args(argv)
+    return run_batch(args)
+
+
+def interactive():
     while True:
         print("\nВыберите операцию:")
         print("1. Перевести число в двоичный формат")
@@ -96,4 +252,4 @@ def main():
             print("Неверный выбор!")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import random
+import sys
+import time
+from Batch_evaluator import BatchEvaluator
+from Expression_parser import _parse
+from Logic_solver import _compile, compile_batch
+from Table_generate import TruthTableGenerator
+from Truth_table import variable_slices
+
+_OPERATORS = ('&', '|', '->', '~')
+
+
+def random_expression(variables, depth):
+    """Случайное выражение; листья повторяются, как в выходах одной схемы"""
+    if depth == 0 or random.random() < 0.15:
+        name = random.choice(variables)
+        return f"!{name}" if random.random() < 0.3 else name
+    left = random_expression(variables, depth - 1)
+    right = random_expression(variables, depth - 1)
+    return f"({left} {random.choice(_OPERATORS)} {right})"
+
+
+def _clear_caches():
+    # Без этого второй способ получил бы готовые срезы и скомпилированный код первого
+    _parse.cache_clear()
+    variable_slices.cache_clear()
+    _compile.cache_clear()
+    compile_batch.cache_clear()
+
+
+def _timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(count=1000, variable_count=10, depth=6):
+    """Время (с) по этапам: отдельный генератор на каждое выражение против одного пакета"""
+    variables = [f"x{i}" for i in range(variable_count)]
+    expressions = [random_expression(variables, depth) for _ in range(count)]
+
+    _clear_caches()
+    separate, separate_time = _timed(
+        lambda: [TruthTableGenerator(expression).compute_index_form()["decimal"] for expression in expressions])
+
+    _clear_caches()
+    evaluator, setup_time = _timed(lambda: BatchEvaluator(variables))
+    function, compile_time = _timed(lambda: evaluator.compile(expressions))
+    columns, evaluate_time = _timed(lambda: function(*evaluator.slices, evaluator.mask))
+
+    # Отдельный генератор строит таблицу только по своим переменным — сравниваем по общему набору
+    reference = BatchEvaluator(variables)
+    expected = [reference.evaluate([expression])[0] for expression in expressions]
+    assert list(columns) == expected
+    assert len(separate) == count
+    return separate_time, setup_time, compile_time, evaluate_time
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    variable_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    separate, setup, compiling, evaluating = run_benchmark(count, variable_count)
+    batch = setup + compiling + evaluating
+    print(f"Выражений: {count}, переменных: {variable_count}, строк: {1 << variable_count}")
+    print(f"{'отдельные генераторы':<22} | {separate * 1e3:>9.1f} мс | {separate / count * 1e6:>8.1f} мкс/выраж.")
+    print(f"{'пакет: срезы':<22} | {setup * 1e3:>9.1f} мс")
+    print(f"{'пакет: компиляция':<22} | {compiling * 1e3:>9.1f} мс")
+    print(f"{'пакет: вычисление':<22} | {evaluating * 1e3:>9.1f} мс")
+    print(f"{'пакет: всего':<22} | {batch * 1e3:>9.1f} мс | {batch / count * 1e6:>8.1f} мкс/выраж.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from Expression_parser import parse_expression
+from Logic_solver import compile_batch
+from Symbol_table import natural_key
+from Truth_table import variable_slices
+
+
+class BatchEvaluator:
+    """Вычисление многих выражений над одним набором переменных.
+
+    Срезы переменных и маска строятся один раз, все выражения компилируются в одну
+    функцию по общему DAG, и каждый узел — одна побитовая операция по всем строкам.
+    Результат — матрица «выражения × строки»: по столбцу (2^n-битному целому,
+    строка 0 — старший бит) на выражение, то есть индексная форма каждой функции.
+    """
+
+    def __init__(self, variables):
+        self.variables = tuple(variables)
+        count = len(self.variables)
+        self.size = 1 << count
+        self.slices = variable_slices(count)
+        self.mask = (1 << self.size) - 1
+
+    @classmethod
+    def from_expressions(cls, expressions):
+        """Набор переменных — объединение переменных всех выражений в естественном порядке"""
+        names = set()
+        for expression in expressions:
+            names.update(parse_expression(expression).symbols)
+        return cls(sorted(names, key=natural_key))
+
+    def compile(self, expressions):
+        """Функция от срезов и маски, возвращающая кортеж столбцов результатов"""
+        rpn_exprs = tuple(parse_expression(expression).rpn for expression in expressions)
+        return compile_batch(rpn_exprs, self.variables)
+
+    def evaluate(self, expressions):
+        """Столбцы результатов всех выражений (по одному целому на выражение)"""
+        return self.compile(expressions)(*self.slices, self.mask)
+
+    def index_matrix(self, expressions):
+        """Матрица индексных форм: строка на выражение, символ '0'/'1' на строку таблицы"""
+        width = f'0{self.size}b'
+        return [format(column, width) for column in self.evaluate(expressions)]
+
+    def index_forms(self, expressions):
+        """Индексные формы в виде TruthTableGenerator.compute_index_form (над общим набором переменных)"""
+        width = f'0{self.size}b'
+        return [{"binary": format(column, width), "decimal": column} for column in self.evaluate(expressions)]
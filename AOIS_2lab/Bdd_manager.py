@@ -0,0 +1,234 @@
+import sys
+from Expression_dag import CONSTANTS
+
+FALSE = 0
+TRUE = 1
+# Уровень терминальных узлов — ниже любой переменной
+_TERMINAL_LEVEL = sys.maxsize
+
+
+class BddManager:
+    """Сокращённые упорядоченные диаграммы решений (ROBDD).
+
+    Узел — целое число: 0 и 1 — терминалы, остальные — (уровень, low, high) в
+    таблице уникальности, поэтому равные функции всегда представлены одним узлом,
+    и проверка эквивалентности — сравнение чисел. Все операции сводятся к ITE с
+    кешем вычисленных результатов. Уровень переменной — её место в self.order.
+    """
+
+    def __init__(self, variables=()):
+        self.order = []
+        self._levels = {}
+        self._level = [_TERMINAL_LEVEL, _TERMINAL_LEVEL]
+        self._low = [FALSE, TRUE]
+        self._high = [FALSE, TRUE]
+        self._unique = {}
+        self._computed = {}
+        for name in variables:
+            self.variable(name)
+
+    def variable(self, name):
+        """Узел функции «значение переменной»; новая переменная добавляется в конец порядка"""
+        if name not in self._levels:
+            self._levels[name] = len(self.order)
+            self.order.append(name)
+        return self._make(self._levels[name], FALSE, TRUE)
+
+    def _make(self, level, low, high):
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = self._unique[key] = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+        return node
+
+    def ite(self, f, g, h):
+        """if f then g else h — базовая операция, через которую выражаются все остальные"""
+        if f == TRUE:
+            return g
+        if f == FALSE:
+            return h
+        if g == h:
+            return g
+        if g == TRUE and h == FALSE:
+            return f
+        key = (f, g, h)
+        result = self._computed.get(key)
+        if result is None:
+            top = min(self._level[f], self._level[g], self._level[h])
+            f0, f1 = self._cofactors(f, top)
+            g0, g1 = self._cofactors(g, top)
+            h0, h1 = self._cofactors(h, top)
+            result = self._make(top, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+            self._computed[key] = result
+        return result
+
+    def _cofactors(self, node, level):
+        if self._level[node] == level:
+            return self._low[node], self._high[node]
+        return node, node
+
+    def negate(self, f):
+        return self.ite(f, FALSE, TRUE)
+
+    def apply(self, operator, f, g):
+        if operator == '&':
+            return self.ite(f, g, FALSE)
+        if operator == '|':
+            return self.ite(f, TRUE, g)
+        if operator == '->':
+            return self.ite(f, g, TRUE)
+        if operator == '~':
+            return self.ite(f, g, self.negate(g))
+        raise ValueError(f"Неизвестный оператор: '{operator}'")
+
+    def from_rpn(self, rpn_expr):
+        """Строит диаграмму прямо по ОПН, без перебора строк таблицы"""
+        stack = []
+        for token in rpn_expr:
+            if token == '!':
+                stack.append(self.negate(stack.pop()))
+            elif token in ('&', '|', '->', '~'):
+                right, left = stack.pop(), stack.pop()
+                stack.append(self.apply(token, left, right))
+            elif token in CONSTANTS:
+                stack.append(TRUE if CONSTANTS[token] else FALSE)
+            else:
+                stack.append(self.variable(token))
+        if len(stack) != 1:
+            raise ValueError("Некорректная ОПН")
+        return stack[0]
+
+    def is_tautology(self, f):
+        return f == TRUE
+
+    def is_satisfiable(self, f):
+        return f != FALSE
+
+    def equivalent(self, f, g):
+        """Функции равны тогда и только тогда, когда совпадают их узлы"""
+        return f == g
+
+    def sat_count(self, f):
+        """Число наборов всех переменных порядка, на которых f истинна (термов СДНФ)"""
+        count = len(self.order)
+        memo = {FALSE: 0, TRUE: 1}
+
+        def level(node):
+            return count if node in (FALSE, TRUE) else self._level[node]
+
+        def walk(node):
+            if node not in memo:
+                low, high = self._low[node], self._high[node]
+                memo[node] = (walk(low) << (level(low) - level(node) - 1)) + \
+                             (walk(high) << (level(high) - level(node) - 1))
+            return memo[node]
+
+        return walk(f) << level(f)
+
+    def cube_count(self, f, value=True):
+        """Число путей к терминалу value: кубы ДНФ (value=True) или дизъюнкты КНФ по диаграмме"""
+        target = TRUE if value else FALSE
+        memo = {target: 1, 1 - target: 0}
+
+        def walk(node):
+            if node not in memo:
+                memo[node] = walk(self._low[node]) + walk(self._high[node])
+            return memo[node]
+
+        return walk(f)
+
+    def iter_cubes(self, f, value=True):
+        """Пути к терминалу value как словари {переменная: значение}; пропущенные — безразличны"""
+        target = TRUE if value else FALSE
+        stack = [(f, {})]
+        while stack:
+            node, cube = stack.pop()
+            if node == target:
+                yield cube
+            elif node != 1 - target:
+                name = self.order[self._level[node]]
+                stack.append((self._high[node], {**cube, name: True}))
+                stack.append((self._low[node], {**cube, name: False}))
+
+    def index_form(self, f):
+        """Индексная форма: столбец результата по всем 2^n строкам (строка 0 — старший бит).
+
+        Строится по диаграмме склейкой половин, без вычисления строк по отдельности,
+        но размер результата всё равно 2^n бит — только для небольшого числа переменных.
+        """
+        count = len(self.order)
+        memo = {}
+
+        def bits(node, level):
+            key = (node, level)
+            if key not in memo:
+                if level == count:
+                    memo[key] = int(node == TRUE)
+                else:
+                    low, high = self._cofactors(node, level)
+                    half = 1 << (count - level - 1)
+                    memo[key] = (bits(low, level + 1) << half) | bits(high, level + 1)
+            return memo[key]
+
+        result = bits(f, 0)
+        return {"binary": format(result, f'0{1 << count}b'), "decimal": result}
+
+    def size(self, *roots):
+        """Число различных узлов, достижимых из roots (включая терминалы)"""
+        seen = set()
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                if node not in (FALSE, TRUE):
+                    stack.extend((self._low[node], self._high[node]))
+        return len(seen)
+
+    def reorder(self, order, roots):
+        """Перестраивает диаграммы roots в новом менеджере с порядком order.
+
+        Возвращает (менеджер, новые корни); узлы переносятся через ITE по переменной.
+        """
+        manager = BddManager(order)
+        memo = {FALSE: FALSE, TRUE: TRUE}
+
+        def transfer(node):
+            if node not in memo:
+                variable = manager.variable(self.order[self._level[node]])
+                memo[node] = manager.ite(variable, transfer(self._high[node]), transfer(self._low[node]))
+            return memo[node]
+
+        return manager, [transfer(root) for root in roots]
+
+    def sift(self, roots):
+        """Просеивание: каждая переменная по очереди ставится на лучшее место в порядке.
+
+        Каждое место проверяется перестройкой диаграммы; возвращает (менеджер, корни)
+        с наименьшим найденным суммарным размером.
+        """
+        best_manager, best_roots = self.reorder(self.order, roots)
+        best_size = best_manager.size(*best_roots)
+        for name in list(self.order):
+            base = [other for other in best_manager.order if other != name]
+            for position in range(len(base) + 1):
+                order = base[:position] + [name] + base[position:]
+                if order == best_manager.order:
+                    continue
+                manager, candidate = best_manager.reorder(order, best_roots)
+                size = manager.size(*candidate)
+                if size < best_size:
+                    best_manager, best_roots, best_size = manager, candidate, size
+        return best_manager, best_roots
+
+    def clear_cache(self):
+        """Освобождает кеш ITE (таблица уникальности сохраняется)"""
+        self._computed.clear()
+
+    def __len__(self):
+        return len(self._level)
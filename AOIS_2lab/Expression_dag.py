@@ -0,0 +1,75 @@
+from collections import namedtuple
+
+# Узел DAG: у переменной operator = None и operands = (имя,), у оператора — индексы узлов-операндов
+DagNode = namedtuple('DagNode', ['operator', 'operands'])
+
+# Константы в ОПН (после упрощения): парсер их не порождает, поэтому с именами они не совпадают
+CONSTANTS = {'0': False, '1': True}
+
+# Для этих операторов порядок операндов не важен: a & b и b & a — один узел
+_COMMUTATIVE = {'&', '|', '~'}
+
+
+class ExpressionDag:
+    """Выражение как ориентированный ациклический граф с хеш-консингом.
+
+    Одинаковые подвыражения представлены одним узлом, поэтому память линейна
+    по числу различных подвыражений, а каждое из них вычисляется один раз.
+    Узлы нумеруются в порядке создания — это топологический порядок.
+    """
+
+    def __init__(self):
+        self.nodes = []
+        self._unique = {}
+        self._infix = []
+
+    @classmethod
+    def from_rpn(cls, rpn_expr):
+        """Строит DAG по ОПН; возвращает (dag, индекс корня или None для пустой ОПН)"""
+        dag = cls()
+        return dag, dag.add_rpn(rpn_expr)
+
+    def add_rpn(self, rpn_expr):
+        """Добавляет выражение в ОПН к графу; общие с уже добавленными подвыражения не дублируются.
+
+        Возвращает индекс корня (None для пустой ОПН).
+        """
+        stack = []
+        for token in rpn_expr:
+            if token == '!':
+                stack.append(self.add('!', (stack.pop(),)))
+            elif token in ('&', '|', '->', '~'):
+                right, left = stack.pop(), stack.pop()
+                stack.append(self.add(token, (left, right)))
+            else:
+                stack.append(self.add(None, (token,)))
+        return stack[-1] if stack else None
+
+    def add(self, operator, operands):
+        """Возвращает индекс узла, создавая его, только если такого ещё нет"""
+        key = (operator, tuple(sorted(operands)) if operator in _COMMUTATIVE else operands)
+        index = self._unique.get(key)
+        if index is None:
+            index = self._unique[key] = len(self.nodes)
+            self.nodes.append(DagNode(operator, operands))
+        return index
+
+    def operator_nodes(self):
+        """Индексы узлов-операторов в топологическом порядке"""
+        return [index for index, node in enumerate(self.nodes) if node.operator is not None]
+
+    def to_infix(self, index):
+        """Инфиксная запись узла; записи строятся по порядку узлов без рекурсии и запоминаются"""
+        for node in self.nodes[len(self._infix):index + 1]:
+            if node.operator is None:
+                text = node.operands[0]
+            elif node.operator == '!':
+                text = f"!{self._infix[node.operands[0]]}"
+            else:
+                left, right = node.operands
+                text = f"({self._infix[left]} {node.operator} {self._infix[right]})"
+            self._infix.append(text)
+        return self._infix[index]
+
+    def __len__(self):
+        return len(self.nodes)
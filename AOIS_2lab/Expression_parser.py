@@ -0,0 +1,101 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+from Symbol_table import SymbolTable
+
+# Узлы синтаксического дерева
+Var = namedtuple('Var', ['name'])
+Not = namedtuple('Not', ['operand'])
+BinaryOp = namedtuple('BinaryOp', ['operator', 'left', 'right'])
+
+# Результат разбора: токены, ОПН и дерево неизменяемы, поэтому разбор кешируется и переиспользуется
+ParsedExpression = namedtuple('ParsedExpression', ['expression', 'tokens', 'rpn', 'ast', 'symbols'])
+
+DEFAULT_PRECEDENCE = {'!': 4, '~': 4, '&': 3, '|': 2, '->': 1}
+# Операторы, которые различает токенизатор; таблица приоритетов задаёт только их порядок
+OPERATORS = frozenset(DEFAULT_PRECEDENCE)
+_BINARY_OPERATORS = OPERATORS - {'!'}
+
+_TOKEN = re.compile(r'\s*(?:(?P<name>[A-Za-z_][A-Za-z0-9_]*)|(?P<operator>->|[!&|~()])|(?P<bad>\S))')
+
+
+def tokenize(expression):
+    """Генератор пар (токен, позиция) за один проход; позиции считаются с 1"""
+    for match in _TOKEN.finditer(expression):
+        if match.lastgroup == 'bad':
+            position = match.start('bad') + 1
+            if match.group('bad') == '-':
+                raise ValueError(f"Некорректный оператор '->' в позиции {position}")
+            raise ValueError(f"Недопустимый символ '{match.group('bad')}' в позиции {position}")
+        yield match.group(match.lastgroup), match.start(match.lastgroup) + 1
+
+
+def parse_expression(expression, precedence=None):
+    """Проверяет выражение и строит ОПН и синтаксическое дерево за один линейный проход"""
+    items = tuple(sorted((precedence or DEFAULT_PRECEDENCE).items()))
+    return _parse(expression, items)
+
+
+@lru_cache(maxsize=128)
+def _parse(expression, precedence_items):
+    precedence = dict(precedence_items)
+    unknown = sorted(set(precedence) - OPERATORS)
+    if unknown:
+        raise ValueError(f"Неизвестные операторы в таблице приоритетов: {', '.join(unknown)}")
+    tokens = []
+    rpn = []
+    nodes = []
+    # Стек операторов: (токен, позиция); позиция нужна для сообщения о незакрытой скобке
+    operators = []
+    names = set()
+    expect_operand = True
+
+    def emit(operator):
+        rpn.append(operator)
+        if operator == '!':
+            nodes.append(Not(nodes.pop()))
+        else:
+            right = nodes.pop()
+            nodes.append(BinaryOp(operator, nodes.pop(), right))
+
+    for token, position in tokenize(expression):
+        if token in OPERATORS and token not in precedence:
+            raise ValueError(f"Оператор '{token}' в позиции {position} отсутствует в таблице приоритетов")
+        tokens.append(token)
+        if expect_operand:
+            if token == '(' or token == '!':
+                # Унарный оператор префиксный: он ничего не выталкивает со стека
+                operators.append((token, position))
+            elif token in _BINARY_OPERATORS or token == ')':
+                raise ValueError(f"Ожидалась переменная или '(' в позиции {position}, а не '{token}'")
+            else:
+                rpn.append(token)
+                nodes.append(Var(token))
+                names.add(token)
+                expect_operand = False
+        elif token == ')':
+            while operators and operators[-1][0] != '(':
+                emit(operators.pop()[0])
+            if not operators:
+                raise ValueError(f"Лишняя закрывающая скобка в позиции {position}")
+            operators.pop()
+        elif token in _BINARY_OPERATORS:
+            # Бинарные операторы левоассоциативны: выталкиваются операторы не ниже по приоритету
+            while operators and operators[-1][0] != '(' and precedence[operators[-1][0]] >= precedence[token]:
+                emit(operators.pop()[0])
+            operators.append((token, position))
+            expect_operand = True
+        else:
+            raise ValueError(f"Ожидался оператор в позиции {position}, а не '{token}'")
+
+    if not tokens:
+        raise ValueError("Пустое выражение")
+    if expect_operand:
+        raise ValueError(f"Выражение обрывается: после '{tokens[-1]}' ожидалась переменная")
+    while operators:
+        token, position = operators.pop()
+        if token == '(':
+            raise ValueError(f"Незакрытая скобка в позиции {position}")
+        emit(token)
+
+    return ParsedExpression(expression, tuple(tokens), tuple(rpn), nodes[0], SymbolTable.from_tokens(names))
@@ -1,27 +1,126 @@
-from Validator import LogicalExpressionChecker  # Новый импорт
+from functools import lru_cache
+from Expression_dag import CONSTANTS, ExpressionDag
+from Symbol_table import natural_key
+
+# Шаблоны кода для операторов; операнды — всегда простые имена, поэтому скобки не нужны
+_UNARY_TEMPLATES = {'!': 'not {0}'}
+_BINARY_TEMPLATES = {
+    '&': '{0} and {1}',
+    '|': '{0} or {1}',
+    '->': 'not {0} or {1}',
+    '~': '{0} == {1}',
+}
+# Те же операторы над битовыми срезами: m — маска из 2^n единиц, отрицание — XOR с ней
+_BITWISE_UNARY_TEMPLATES = {'!': '{0} ^ m'}
+_BITWISE_BINARY_TEMPLATES = {
+    '&': '{0} & {1}',
+    '|': '{0} | {1}',
+    '->': '{0} ^ m | {1}',
+    '~': '{0} ^ {1} ^ m',
+}
+_OPERATORS = set(_UNARY_TEMPLATES) | set(_BINARY_TEMPLATES)
+
 
 class LogicSolver:
-    def __init__(self, rpn_expr):
+    """Вычисляет выражение в ОПН.
+
+    ОПН один раз компилируется в функцию Python от позиционных аргументов
+    (по одному на переменную в порядке self.variables — списка или SymbolTable,
+    индекс имени равен номеру аргумента); скомпилированный код
+    кешируется по ОПН, так что вычисление в точке — один вызов функции.
+    """
+
+    def __init__(self, rpn_expr, variables=None):
         self.rpn_expr = rpn_expr
-        self._allowed_vars = LogicalExpressionChecker._ALLOWED_VARS  # Используем новую константу
+        if variables is None:
+            variables = sorted({token for token in rpn_expr if token not in _OPERATORS and token not in CONSTANTS},
+                               key=natural_key)
+        self.variables = tuple(variables)
+        self.function = _compile(tuple(rpn_expr), self.variables, False)
+
+    @property
+    def steps_function(self):
+        """Функция, возвращающая значения различных узлов-операторов DAG в порядке DAG и в конце — результат.
+
+        Повторяющееся подвыражение — один узел, поэтому его значение входит в кортеж один раз.
+        """
+        return _compile(tuple(self.rpn_expr), self.variables, True)
+
+    @property
+    def slice_function(self):
+        """Как steps_function, но над битовыми срезами: f(срез_0, ..., срез_n-1, маска).
+
+        Каждый оператор — одна побитовая операция длинных целых сразу по всем строкам таблицы.
+        """
+        return _compile(tuple(self.rpn_expr), self.variables, True, True)
+
+    @property
+    def bitwise_function(self):
+        """Только столбец результата над битовыми срезами: f(срез_0, ..., срез_n-1, маска)"""
+        return _compile(tuple(self.rpn_expr), self.variables, False, True)
 
     def compute(self, values):
-        stack = []
-        for token in self.rpn_expr:
-            if token in self._allowed_vars:  # Используем сохранённый набор переменных
-                stack.append(values[token])
-            elif token == '!':
-                stack.append(not stack.pop())
-            elif token == '&':
-                right, left = stack.pop(), stack.pop()
-                stack.append(left and right)
-            elif token == '|':
-                right, left = stack.pop(), stack.pop()
-                stack.append(left or right)
-            elif token == '->':
-                right, left = stack.pop(), stack.pop()
-                stack.append((not left) or right)
-            elif token == '~':
-                right, left = stack.pop(), stack.pop()
-                stack.append(left == right)
-        return stack[0] if stack else None
\ No newline at end of file
+        return self.function(*[values[name] for name in self.variables])
+
+
+@lru_cache(maxsize=1024)
+def _compile(rpn_expr, variables, all_steps, bitwise=False):
+    """Генерирует функцию в виде последовательности присваиваний t_i = ... без вложенности.
+
+    Код строится по DAG выражения: одинаковые подвыражения вычисляются один раз,
+    а all_steps возвращает значения различных узлов-операторов в порядке DAG.
+    """
+    dag, root = ExpressionDag.from_rpn(rpn_expr)
+    names, lines = _generate(dag, variables, bitwise)
+    result = names[root] if root is not None else "None"
+    if all_steps:
+        result = "(" + "".join(f"t{i}, " for i in range(len(lines))) + result + ",)"
+    return _define(variables, bitwise, lines, result, ' '.join(rpn_expr))
+
+
+@lru_cache(maxsize=64)
+def compile_batch(rpn_exprs, variables):
+    """Одна функция для многих выражений над срезами: f(срез_0, ..., срез_n-1, маска).
+
+    Все ОПН добавляются в общий DAG, поэтому подвыражения, общие для разных
+    выражений, вычисляются один раз; функция возвращает кортеж столбцов результатов.
+    """
+    dag = ExpressionDag()
+    roots = [dag.add_rpn(rpn_expr) for rpn_expr in rpn_exprs]
+    names, lines = _generate(dag, variables, True)
+    result = "(" + "".join(f"{names[root]}, " for root in roots) + ")"
+    return _define(variables, True, lines, result, f"{len(rpn_exprs)} выражений")
+
+
+def _generate(dag, variables, bitwise):
+    """Имена значений всех узлов DAG и строки присваиваний для узлов-операторов"""
+    unary = _BITWISE_UNARY_TEMPLATES if bitwise else _UNARY_TEMPLATES
+    binary = _BITWISE_BINARY_TEMPLATES if bitwise else _BINARY_TEMPLATES
+    index = {name: position for position, name in enumerate(variables)}
+    names = []
+    lines = []
+    for node in dag.nodes:
+        if node.operator is None and node.operands[0] in CONSTANTS:
+            # Истина над срезами — маска (все строки), ложь — ноль
+            value = CONSTANTS[node.operands[0]]
+            names.append(("m" if value else "0") if bitwise else str(value))
+            continue
+        if node.operator is None:
+            if node.operands[0] not in index:
+                raise ValueError(f"Неизвестная переменная: '{node.operands[0]}'")
+            names.append(f"v{index[node.operands[0]]}")
+            continue
+        operands = [names[operand] for operand in node.operands]
+        template = unary[node.operator] if node.operator in unary else binary[node.operator]
+        names.append(f"t{len(lines)}")
+        lines.append(f"    {names[-1]} = {template.format(*operands)}")
+    return names, lines
+
+
+def _define(variables, bitwise, lines, result, title):
+    arguments = ", ".join([f"v{i}" for i in range(len(variables))] + (["m"] if bitwise else []))
+    source = f"def solver({arguments}):\n" + "".join(line + "\n" for line in lines) + f"    return {result}\n"
+
+    namespace = {}
+    exec(compile(source, f"<ОПН {title}>", "exec"), namespace)
+    return namespace["solver"]
@@ -0,0 +1,346 @@
+import heapq
+from Expression_parser import Not, Var, parse_expression
+
+
+class TseitinEncoder:
+    """Преобразование Цейтина: выражение -> равновыполнимая КНФ линейного размера.
+
+    Переменные выражения и вентили нумеруются с 1, как в DIMACS; литерал —
+    номер со знаком. Одинаковые вентили (оператор, литералы операндов) кодируются
+    один раз, поэтому несколько выражений в одном кодировщике делят общие части.
+    """
+
+    def __init__(self):
+        self.num_vars = 0
+        self.clauses = []
+        self.names = {}
+        self._gates = {}
+
+    def variable(self, name):
+        if name not in self.names:
+            self.num_vars += 1
+            self.names[name] = self.num_vars
+        return self.names[name]
+
+    def encode(self, expression):
+        """Кодирует выражение и возвращает литерал его значения"""
+        return self.encode_ast(parse_expression(expression).ast)
+
+    def encode_ast(self, root):
+        # Обход дерева в обратном порядке без рекурсии: глубина выражения не ограничена
+        results = []
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if isinstance(node, Var):
+                results.append(self.variable(node.name))
+            elif not expanded:
+                stack.append((node, True))
+                children = (node.operand,) if isinstance(node, Not) else (node.left, node.right)
+                stack.extend((child, False) for child in reversed(children))
+            elif isinstance(node, Not):
+                results.append(-results.pop())
+            else:
+                right = results.pop()
+                results.append(self.gate(node.operator, results.pop(), right))
+        return results[0]
+
+    def gate(self, operator, a, b):
+        """Литерал g, для которого добавлены дизъюнкты g <-> (a operator b)"""
+        key = (operator, a, b) if operator == '->' else (operator, min(a, b), max(a, b))
+        if key in self._gates:
+            return self._gates[key]
+        self.num_vars += 1
+        g = self._gates[key] = self.num_vars
+        if operator == '&':
+            self.clauses += [[-g, a], [-g, b], [g, -a, -b]]
+        elif operator == '|':
+            self.clauses += [[g, -a], [g, -b], [-g, a, b]]
+        elif operator == '->':
+            self.clauses += [[g, a], [g, -b], [-g, -a, b]]
+        elif operator == '~':
+            self.clauses += [[-g, -a, b], [-g, a, -b], [g, a, b], [g, -a, -b]]
+        else:
+            raise ValueError(f"Неизвестный оператор: '{operator}'")
+        return g
+
+    def write_dimacs(self, stream, units=()):
+        """Пишет КНФ (и дополнительные однолитеральные дизъюнкты units) в формате DIMACS"""
+        for name, var in self.names.items():
+            stream.write(f"c {var} {name}\n")
+        stream.write(f"p cnf {self.num_vars} {len(self.clauses) + len(units)}\n")
+        for clause in self.clauses:
+            stream.write(" ".join(map(str, clause)) + " 0\n")
+        for literal in units:
+            stream.write(f"{literal} 0\n")
+
+
+def luby(index):
+    """index-й член последовательности Люби (с 1): 1, 1, 2, 1, 1, 2, 4, ..."""
+    # Член равен 2^(k-1) в конце блока длины 2^k - 1, иначе последовательность повторяется
+    while True:
+        k = index.bit_length()
+        if index == (1 << k) - 1:
+            return 1 << (k - 1)
+        index -= (1 << (k - 1)) - 1
+
+
+class CdclSolver:
+    """CDCL: два наблюдаемых литерала, обучение по первой точке доминирования (1UIP),
+    выбор переменной по активности (VSIDS), сохранение фазы и перезапуски по Люби.
+
+    Значения хранятся в списках, индексируемых литералом: для -v Python берёт
+    элемент с конца, поэтому оба знака переменной адресуются без пересчёта.
+    """
+
+    RESTART_UNIT = 64
+    ACTIVITY_DECAY = 0.95
+
+    def __init__(self, num_vars, clauses=()):
+        self.num_vars = num_vars
+        size = 2 * num_vars + 1
+        self.values = [0] * size
+        self.watches = [[] for _ in range(size)]
+        self.level = [0] * (num_vars + 1)
+        self.reason = [None] * (num_vars + 1)
+        self.activity = [0.0] * (num_vars + 1)
+        self.phase = [False] * (num_vars + 1)
+        self.trail = []
+        self.trail_limits = []
+        self.head = 0
+        self.increment = 1.0
+        self.learned = 0
+        self.conflicts = 0
+        self.ok = True
+        for clause in clauses:
+            self.add_clause(clause)
+
+    @classmethod
+    def from_dimacs(cls, stream):
+        solver = None
+        pending = []
+        for line in stream:
+            fields = line.split()
+            if not fields or fields[0] == 'c':
+                continue
+            if fields[0] == 'p':
+                if len(fields) != 4 or fields[1] != 'cnf':
+                    raise ValueError(f"Некорректный заголовок DIMACS: '{line.strip()}'")
+                solver = cls(int(fields[2]))
+                continue
+            if solver is None:
+                raise ValueError("Дизъюнкт до заголовка 'p cnf'")
+            pending.extend(map(int, fields))
+            while 0 in pending:
+                end = pending.index(0)
+                solver.add_clause(pending[:end])
+                pending = pending[end + 1:]
+        if solver is None:
+            raise ValueError("Нет заголовка 'p cnf'")
+        return solver
+
+    def add_clause(self, clause):
+        """Добавляет дизъюнкт до начала поиска (на нулевом уровне)"""
+        for literal in clause:
+            # Литерал вне диапазона попал бы в ячейку другой переменной (индексы со знаком)
+            if not 0 < abs(literal) <= self.num_vars:
+                raise ValueError(f"Литерал {literal} вне диапазона 1..{self.num_vars}")
+        literals = list(dict.fromkeys(clause))
+        unique = set(literals)
+        if any(-literal in unique for literal in literals):
+            return
+        literals = [literal for literal in literals if self.values[literal] != -1]
+        if any(self.values[literal] == 1 for literal in literals):
+            return
+        if not literals:
+            self.ok = False
+        elif len(literals) == 1:
+            self._assign(literals[0], None)
+            self.ok = self.ok and self._propagate() is None
+        else:
+            self.watches[literals[0]].append(literals)
+            self.watches[literals[1]].append(literals)
+
+    def solve(self):
+        """True — выполнима (модель в self.model()), False — невыполнима"""
+        if not self.ok or self._propagate() is not None:
+            self.ok = False
+            return False
+        heap = self._rebuild_heap()
+        restart = 1
+        budget = luby(restart) * self.RESTART_UNIT
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                budget -= 1
+                if not self.trail_limits:
+                    self.ok = False
+                    return False
+                learnt, back_level = self._analyze(conflict)
+                self._backtrack(back_level, heap)
+                if len(learnt) == 1:
+                    self._assign(learnt[0], None)
+                else:
+                    self.watches[learnt[0]].append(learnt)
+                    self.watches[learnt[1]].append(learnt)
+                    self.learned += 1
+                    self._assign(learnt[0], learnt)
+                self._decay()
+                continue
+            if budget <= 0:
+                restart += 1
+                budget = luby(restart) * self.RESTART_UNIT
+                self._backtrack(0, heap)
+                heap = self._rebuild_heap()
+                continue
+            variable = self._pick(heap)
+            if variable is None:
+                return True
+            self.trail_limits.append(len(self.trail))
+            self._assign(variable if self.phase[variable] else -variable, None)
+
+    def model(self):
+        return {variable: self.values[variable] == 1 for variable in range(1, self.num_vars + 1)}
+
+    def _assign(self, literal, reason):
+        variable = abs(literal)
+        self.values[literal] = 1
+        self.values[-literal] = -1
+        self.level[variable] = len(self.trail_limits)
+        self.reason[variable] = reason
+        self.trail.append(literal)
+
+    def _propagate(self):
+        """Распространение единичных дизъюнктов; возвращает конфликтный дизъюнкт или None"""
+        values = self.values
+        watches = self.watches
+        while self.head < len(self.trail):
+            false_literal = -self.trail[self.head]
+            self.head += 1
+            watching = watches[false_literal]
+            kept = []
+            position = 0
+            while position < len(watching):
+                clause = watching[position]
+                position += 1
+                # Ложный наблюдаемый литерал всегда держим на месте 1
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], false_literal
+                first = clause[0]
+                if values[first] == 1:
+                    kept.append(clause)
+                    continue
+                for index in range(2, len(clause)):
+                    if values[clause[index]] != -1:
+                        clause[1], clause[index] = clause[index], false_literal
+                        watches[clause[1]].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if values[first] == -1:
+                        kept.extend(watching[position:])
+                        watches[false_literal] = kept
+                        return clause
+                    self._assign(first, clause)
+            watches[false_literal] = kept
+        return None
+
+    def _analyze(self, conflict):
+        """Обучаемый дизъюнкт по 1UIP и уровень, на который нужно откатиться"""
+        current = len(self.trail_limits)
+        seen = set()
+        learnt = [None]
+        pending = 0
+        literal = None
+        index = len(self.trail) - 1
+        clause = conflict
+        while True:
+            for other in (clause if literal is None else clause[1:]):
+                variable = abs(other)
+                if variable not in seen and self.level[variable] > 0:
+                    seen.add(variable)
+                    self._bump(variable)
+                    if self.level[variable] == current:
+                        pending += 1
+                    else:
+                        learnt.append(other)
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            literal = self.trail[index]
+            index -= 1
+            seen.discard(abs(literal))
+            pending -= 1
+            if pending == 0:
+                break
+            clause = self.reason[abs(literal)]
+        learnt[0] = -literal
+        if len(learnt) == 1:
+            return learnt, 0
+        # Второй наблюдаемый литерал — с самого высокого из оставшихся уровней
+        deepest = max(range(1, len(learnt)), key=lambda i: self.level[abs(learnt[i])])
+        learnt[1], learnt[deepest] = learnt[deepest], learnt[1]
+        return learnt, self.level[abs(learnt[1])]
+
+    def _backtrack(self, level, heap):
+        if len(self.trail_limits) <= level:
+            return
+        start = self.trail_limits[level]
+        for literal in self.trail[start:]:
+            variable = abs(literal)
+            self.values[literal] = self.values[-literal] = 0
+            self.reason[variable] = None
+            self.phase[variable] = literal > 0
+            heapq.heappush(heap, (-self.activity[variable], variable))
+        del self.trail[start:]
+        del self.trail_limits[level:]
+        self.head = len(self.trail)
+
+    def _pick(self, heap):
+        while heap:
+            _, variable = heapq.heappop(heap)
+            if self.values[variable] == 0:
+                return variable
+        return None
+
+    def _rebuild_heap(self):
+        heap = [(-self.activity[v], v) for v in range(1, self.num_vars + 1) if self.values[v] == 0]
+        heapq.heapify(heap)
+        return heap
+
+    def _bump(self, variable):
+        self.activity[variable] += self.increment
+        if self.activity[variable] > 1e100:
+            self.activity = [value * 1e-100 for value in self.activity]
+            self.increment *= 1e-100
+
+    def _decay(self):
+        self.increment /= self.ACTIVITY_DECAY
+
+
+class SatChecker:
+    """Запросы выполнимости, тождественной истинности и эквивалентности без таблицы истинности"""
+
+    @staticmethod
+    def satisfiable(expression):
+        """Возвращает набор значений переменных, на котором выражение истинно, или None"""
+        encoder = TseitinEncoder()
+        root = encoder.encode(expression)
+        solver = CdclSolver(encoder.num_vars, encoder.clauses + [[root]])
+        if not solver.solve():
+            return None
+        model = solver.model()
+        return {name: model[var] for name, var in encoder.names.items()}
+
+    @staticmethod
+    def is_tautology(expression):
+        encoder = TseitinEncoder()
+        root = encoder.encode(expression)
+        return not CdclSolver(encoder.num_vars, encoder.clauses + [[-root]]).solve()
+
+    @staticmethod
+    def are_equivalent(first, second):
+        """Выражения эквивалентны, если их «исключающее или» невыполнимо"""
+        encoder = TseitinEncoder()
+        differ = encoder.gate('~', encoder.encode(first), encoder.encode(second))
+        return not CdclSolver(encoder.num_vars, encoder.clauses + [[-differ]]).solve()
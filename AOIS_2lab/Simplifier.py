@@ -0,0 +1,148 @@
+from collections import namedtuple
+from functools import lru_cache
+from Expression_dag import ExpressionDag
+
+# Упрощённая ОПН и число узлов-операторов (операций на строку таблицы) до и после упрощения
+Simplification = namedtuple('Simplification', ['rpn', 'nodes_before', 'nodes_after'])
+
+
+class Simplifier:
+    """Переписывание выражения снизу вверх по законам алгебры логики.
+
+    Узлы строятся в ExpressionDag с хеш-консингом, поэтому равенство подвыражений —
+    сравнение индексов. Правила: свёртка констант, двойное отрицание, идемпотентность,
+    поглощение, законы дополнения, а -> и ~ с отрицанием операнда понижаются до | и ~
+    без отрицаний. Каждое правило только уменьшает выражение.
+    """
+
+    def __init__(self):
+        self.dag = ExpressionDag()
+        self.false = self.dag.add(None, ('0',))
+        self.true = self.dag.add(None, ('1',))
+
+    def add_rpn(self, rpn_expr):
+        """Упрощает выражение в ОПН; возвращает индекс корня"""
+        stack = []
+        for token in rpn_expr:
+            if token == '!':
+                stack.append(self.negate(stack.pop()))
+            elif token in ('&', '|', '->', '~'):
+                right, left = stack.pop(), stack.pop()
+                stack.append(self.apply(token, left, right))
+            else:
+                stack.append(self.dag.add(None, (token,)))
+        return stack[-1]
+
+    def apply(self, operator, left, right):
+        if operator == '&':
+            return self.conjunction(left, right)
+        if operator == '|':
+            return self.disjunction(left, right)
+        if operator == '->':
+            return self.implication(left, right)
+        return self.equivalence(left, right)
+
+    def negate(self, node):
+        if node == self.true:
+            return self.false
+        if node == self.false:
+            return self.true
+        operator, operands = self.dag.nodes[node]
+        if operator == '!':
+            return operands[0]
+        return self.dag.add('!', (node,))
+
+    def conjunction(self, left, right):
+        return self._lattice('&', left, right, self.false, self.true)
+
+    def disjunction(self, left, right):
+        return self._lattice('|', left, right, self.true, self.false)
+
+    def _lattice(self, operator, left, right, zero, unit):
+        """& и | двойственны: zero поглощает, unit нейтрален"""
+        if zero in (left, right) or self._complementary(left, right):
+            return zero
+        if left == unit or left == right:
+            return right
+        if right == unit:
+            return left
+        for node, other in ((left, right), (right, left)):
+            inner, operands = self.dag.nodes[other]
+            if node in operands:
+                # a & (a | b) = a — поглощение; a & (a & b) = a & b — идемпотентность
+                if inner == _DUAL[operator]:
+                    return node
+                if inner == operator:
+                    return other
+        return self.dag.add(operator, (left, right))
+
+    def implication(self, left, right):
+        if left == self.false or right == self.true or left == right:
+            return self.true
+        if left == self.true:
+            return right
+        operator, operands = self.dag.nodes[left]
+        if operator == '!':
+            # !a -> b = a | b: отрицание исчезает
+            return self.disjunction(operands[0], right)
+        if right == self.false or self._complementary(left, right):
+            # a -> 0 = !a, a -> !a = !a
+            return self.negate(left)
+        return self.dag.add('->', (left, right))
+
+    def equivalence(self, left, right):
+        if left == right:
+            return self.true
+        if self._complementary(left, right):
+            return self.false
+        if self.true in (left, right):
+            return right if left == self.true else left
+        if self.false in (left, right):
+            return self.negate(right if left == self.false else left)
+        (left_operator, left_operands), (right_operator, right_operands) = self.dag.nodes[left], self.dag.nodes[right]
+        if left_operator == '!' and right_operator == '!':
+            # !a ~ !b = a ~ b
+            return self.dag.add('~', (left_operands[0], right_operands[0]))
+        return self.dag.add('~', (left, right))
+
+    def _complementary(self, left, right):
+        return self.dag.nodes[left] == ('!', (right,)) or self.dag.nodes[right] == ('!', (left,))
+
+    def to_rpn(self, root):
+        """ОПН узла без рекурсии; общие узлы выписываются в каждом месте использования"""
+        rpn = []
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            operator, operands = self.dag.nodes[node]
+            if operator is None:
+                rpn.append(operands[0])
+            elif expanded:
+                rpn.append(operator)
+            else:
+                stack.append((node, True))
+                stack.extend((operand, False) for operand in reversed(operands))
+        return rpn
+
+
+_DUAL = {'&': '|', '|': '&'}
+
+
+def _operator_count(rpn_expr):
+    return len(ExpressionDag.from_rpn(rpn_expr)[0].operator_nodes())
+
+
+@lru_cache(maxsize=128)
+def _simplify(rpn_expr):
+    simplifier = Simplifier()
+    rpn = tuple(simplifier.to_rpn(simplifier.add_rpn(rpn_expr)))
+    return Simplification(rpn, _operator_count(rpn_expr), _operator_count(rpn))
+
+
+def simplify(rpn_expr):
+    """Упрощает ОПН; возвращает Simplification с новой ОПН и числом узлов до и после.
+
+    В результате могут появиться константы '0' и '1' (Expression_dag.CONSTANTS), а часть
+    переменных — исчезнуть, если от них функция не зависит.
+    """
+    return _simplify(tuple(rpn_expr))
@@ -0,0 +1,53 @@
+import re
+
+_NUMBER_PART = re.compile(r'(\d+)')
+
+
+def natural_key(name):
+    """Ключ сортировки, при котором x2 идёт раньше x10"""
+    return [int(part) if part.isdigit() else part for part in _NUMBER_PART.split(name)]
+
+
+class SymbolTable:
+    """Таблица имён переменных: имя -> плотный индекс 0..n-1.
+
+    По индексам переменные адресуют позиционные аргументы скомпилированных
+    функций и битовые срезы, поэтому вычислителям не нужны словари.
+    """
+
+    def __init__(self, names=()):
+        self.names = []
+        self._indices = {}
+        for name in names:
+            self.add(name)
+
+    @classmethod
+    def from_tokens(cls, names):
+        """Таблица из имён в естественном порядке (a, b, ..., x2, x10) без повторов"""
+        return cls(sorted(set(names), key=natural_key))
+
+    def add(self, name):
+        """Добавляет имя, если его ещё нет, и возвращает его индекс"""
+        index = self._indices.get(name)
+        if index is None:
+            index = self._indices[name] = len(self.names)
+            self.names.append(name)
+        return index
+
+    def index(self, name):
+        try:
+            return self._indices[name]
+        except KeyError:
+            raise ValueError(f"Неизвестная переменная: '{name}'") from None
+
+    def __getitem__(self, index):
+        return self.names[index]
+
+    def __contains__(self, name):
+        return name in self._indices
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
@@ -1,88 +1,136 @@
-import itertools
-from Validator import LogicalExpressionChecker
-from rpn_converter import ReversePolishNotationConverter
+from Bdd_manager import BddManager
+from Expression_dag import ExpressionDag
+from Expression_parser import parse_expression
 from Logic_solver import LogicSolver
+from Simplifier import simplify
+from Truth_table import BLOCK_BITS, TruthTable, evaluate_sharded, evaluate_to_file, variable_slices
 
 
 class TruthTableGenerator:
-    def __init__(self, expression):
+    def __init__(self, expression, presimplify=False):
+        # При presimplify=True выражение упрощается до построения таблицы (см. self.simplification)
+        self._presimplify = presimplify
         self.expression = expression
-        LogicalExpressionChecker.is_valid(expression)
-
-        self.variables = sorted(set(c for c in expression if c in LogicalExpressionChecker._ALLOWED_VARS))
-        self.rpn_converter = ReversePolishNotationConverter(
-            allowed_vars=LogicalExpressionChecker._ALLOWED_VARS,
-            operator_precedence={'!': 4, '~': 4, '&': 3, '|': 2, '->': 1}
-        )
-        self.subexpressions = []
-        self.subexpression_strings = []
+
+    @property
+    def presimplify(self):
+        return self._presimplify
+
+    @presimplify.setter
+    def presimplify(self, presimplify):
+        """Смена режима упрощения пересобирает выражение и сбрасывает запомненные результаты"""
+        self._presimplify = presimplify
+        self.expression = self._expression
+
+    @property
+    def expression(self):
+        return self._expression
+
+    @expression.setter
+    def expression(self, expression):
+        """Смена выражения: новый разбор и сброс всех запомненных результатов"""
+        # Единственный разбор выражения: проверка, ОПН, дерево и таблица имён
+        self.parsed = parse_expression(expression)
+        self._expression = expression
+        self.symbols = self.parsed.symbols
+        self.variables = list(self.symbols)
+        self.rpn_expr = list(self.parsed.rpn)
+        # Переменные остаются прежними, даже если после упрощения функция от части из них не зависит
+        self.simplification = simplify(self.rpn_expr) if self._presimplify else None
+        if self.simplification is not None:
+            self.rpn_expr = list(self.simplification.rpn)
         self._parse_subexpressions()
+        # Таблица, индексная форма и наборы термов считаются один раз при первом обращении
+        self._cache = {}
 
     def _parse_subexpressions(self):
-        """Разбирает выражение на подвыражения"""
-        stack = []
-        rpn_expr = self.rpn_converter.transform(self.expression)
-
-        for token in rpn_expr:
-            if token in self.variables:
-                stack.append([token])
-            elif token == '!':
-                operand = stack.pop()
-                new_expr = operand + [token]
-                stack.append(new_expr)
-                self.subexpressions.append(new_expr)
-            else:
-                right = stack.pop()
-                left = stack.pop()
-                new_expr = left + right + [token]
-                stack.append(new_expr)
-                self.subexpressions.append(new_expr)
-
-        # Создаем строковые представления подвыражений
-        self.subexpression_strings = [self._rpn_to_str(expr) for expr in self.subexpressions]
-
-    def _rpn_to_str(self, rpn):
-        """Конвертирует ОПН в инфиксную запись"""
-        stack = []
-        for token in rpn:
-            if token in self.variables:
-                stack.append(token)
-            elif token == '!':
-                stack.append(f"!{stack.pop()}")
-            else:
-                right = stack.pop()
-                left = stack.pop()
-                stack.append(f"({left} {token} {right})")
-        return stack[0]
+        """Строит DAG выражения: одинаковые подвыражения — один узел и один столбец таблицы"""
+        self.dag, self.root = ExpressionDag.from_rpn(self.rpn_expr)
+        self.subexpressions = self.dag.operator_nodes()
+
+    @property
+    def subexpression_strings(self):
+        """Инфиксные записи столбцов-подвыражений (строятся только для вывода)"""
+        return [self.dag.to_infix(node) for node in self.subexpressions]
+
+    def evaluate_columns(self):
+        """Столбцы всех подвыражений и результата как 2^n-битные целые (строка 0 — старший бит).
+
+        Каждый узел DAG — одна побитовая операция над всеми строками таблицы сразу.
+        """
+        if 'columns' not in self._cache:
+            count = len(self.variables)
+            evaluate = LogicSolver(self.rpn_expr, self.variables).slice_function
+            self._cache['columns'] = evaluate(*variable_slices(count), (1 << (1 << count)) - 1)
+        return self._cache['columns']
 
     def generate_truth_table(self):
-        """Генерирует полную таблицу истинности"""
-        table = []
-        rpn_expr = self.rpn_converter.transform(self.expression)
-
-        for values in itertools.product([False, True], repeat=len(self.variables)):
-            var_values = dict(zip(self.variables, values))
-
-            sub_results = []
-            for sub_expr in self.subexpressions:
-                solver = LogicSolver(sub_expr)
-                sub_results.append(solver.compute(var_values))
-
-            solver = LogicSolver(rpn_expr)
-            final_result = solver.compute(var_values)
-
-            table.append((var_values, sub_results, final_result))
-
-        return table
-
-    def compute_index_form(self):
+        """Полная таблица истинности: строится один раз, строки собираются лениво при обращении"""
+        if 'table' not in self._cache:
+            columns = self.evaluate_columns()
+            self._cache['table'] = TruthTable(self.variables, columns[:-1], columns[-1])
+        return self._cache['table']
+
+    def result_column(self, workers=None):
+        """Столбец результата; при workers > 1 строки делятся между процессами.
+
+        Части задаются значениями старших переменных, каждый процесс получает ОПН
+        и возвращает упакованный кусок столбца. Столбцы подвыражений при этом не строятся.
+        """
+        if 'columns' in self._cache:
+            return self._cache['columns'][-1]
+        if 'result' not in self._cache:
+            if not workers or workers == 1:
+                return self.evaluate_columns()[-1]
+            self._cache['result'] = evaluate_sharded(self.rpn_expr, self.variables, workers)
+        return self._cache['result']
+
+    def compute_index_form(self, workers=None):
         """Вычисляет индексную форму"""
-        truth_table = self.generate_truth_table()
-        binary = ''.join(str(int(row[2])) for row in truth_table)
-        return {
-            "binary": binary,
-            "decimal": int(binary, 2)
-        }
+        if 'index_form' not in self._cache:
+            result = self.result_column(workers)
+            self._cache['index_form'] = {
+                "binary": format(result, f'0{1 << len(self.variables)}b'),
+                "decimal": result
+            }
+        return dict(self._cache['index_form'])
+
+    def minterms(self):
+        """Номера строк, на которых выражение истинно (термы СДНФ)"""
+        return self._terms()[0]
+
+    def maxterms(self):
+        """Номера строк, на которых выражение ложно (термы СКНФ)"""
+        return self._terms()[1]
+
+    def _terms(self):
+        if 'terms' not in self._cache:
+            binary = self.compute_index_form()["binary"]
+            ones = tuple(index for index, bit in enumerate(binary) if bit == '1')
+            zeros = tuple(index for index, bit in enumerate(binary) if bit == '0')
+            self._cache['terms'] = (ones, zeros)
+        return self._cache['terms']
+
+    def bdd(self):
+        """ROBDD выражения: (менеджер, корень).
+
+        Переменные упорядочены по первому появлению в выражении: соседние в тексте
+        переменные обычно связаны, и такой порядок держит диаграмму компактной.
+        Порядок таблицы (self.variables) можно получить через manager.reorder.
+        """
+        if 'bdd' not in self._cache:
+            order = dict.fromkeys(token for token in self.rpn_expr if token in self.symbols)
+            manager = BddManager(order)
+            self._cache['bdd'] = (manager, manager.from_rpn(self.rpn_expr))
+        return self._cache['bdd']
+
+    def write_result(self, path, block_bits=BLOCK_BITS, workers=None):
+        """Пишет столбец результата в файл упакованными битами блоками по 2^block_bits строк.
+
+        Возвращает количество единиц; подходит для выражений с десятками переменных.
+        При workers > 1 блоки вычисляются в пуле процессов.
+        """
+        return evaluate_to_file(LogicSolver(self.rpn_expr, self.variables), path, block_bits, workers)
 
     def display_table(self):
         """Выводит форматированную таблицу истинности"""
@@ -0,0 +1,27 @@
+import unittest
+from Batch_evaluator import BatchEvaluator
+from Table_generate import TruthTableGenerator
+
+
+class TestBatchEvaluator(unittest.TestCase):
+
+    def test_matches_separate_generators(self):
+        expressions = ["a & b | !c", "(a -> b) ~ c", "!(a & b) | c", "a | b | c"]
+        evaluator = BatchEvaluator(['a', 'b', 'c'])
+        expected = [TruthTableGenerator(expression).compute_index_form() for expression in expressions]
+        self.assertEqual(evaluator.index_forms(expressions), expected)
+        self.assertEqual(evaluator.index_matrix(expressions)[0], "10101011")
+
+    def test_shared_variable_set(self):
+        evaluator = BatchEvaluator.from_expressions(["x2 & x10", "x1 -> x2"])
+        self.assertEqual(evaluator.variables, ('x1', 'x2', 'x10'))
+        # Выражение без x1 над общим набором: обе половины таблицы одинаковы
+        self.assertEqual(evaluator.index_matrix(["x2 & x10"]), ["00010001"])
+
+    def test_unknown_variable(self):
+        with self.assertRaises(ValueError):
+            BatchEvaluator(['a']).evaluate(["a & b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
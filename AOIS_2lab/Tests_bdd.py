@@ -0,0 +1,49 @@
+import unittest
+from Bdd_manager import FALSE, TRUE, BddManager
+from rpn_converter import ReversePolishNotationConverter
+from Table_generate import TruthTableGenerator
+
+
+class TestBddManager(unittest.TestCase):
+
+    def setUp(self):
+        self.converter = ReversePolishNotationConverter()
+
+    def build(self, manager, expression):
+        return manager.from_rpn(self.converter.transform(expression))
+
+    def test_canonical_form(self):
+        manager = BddManager()
+        self.assertTrue(manager.equivalent(self.build(manager, "a -> b"), self.build(manager, "!a | b")))
+        self.assertEqual(self.build(manager, "a | !a"), TRUE)
+        self.assertEqual(self.build(manager, "a & !a"), FALSE)
+        self.assertTrue(manager.is_tautology(self.build(manager, "(a ~ b) ~ (b ~ a)")))
+
+    def test_counts_and_index_form(self):
+        generator = TruthTableGenerator("(a -> b) & (c | !a)")
+        manager, root = generator.bdd()
+        table_order, [root] = manager.reorder(generator.variables, [root])
+        self.assertEqual(table_order.index_form(root), generator.compute_index_form())
+        self.assertEqual(table_order.sat_count(root), len(generator.minterms()))
+        cubes = list(table_order.iter_cubes(root))
+        self.assertEqual(len(cubes), table_order.cube_count(root))
+        self.assertIn({'a': False}, cubes)
+
+    def test_many_variables(self):
+        expression = " | ".join(f"(y{i} & z{i})" for i in range(32))
+        manager, root = TruthTableGenerator(expression).bdd()
+        self.assertEqual(manager.size(root), 66)
+        self.assertEqual(manager.sat_count(root), 4 ** 32 - 3 ** 32)
+
+    def test_sifting_recovers_good_order(self):
+        names = [f"y{i}" for i in range(6)] + [f"z{i}" for i in range(6)]
+        manager = BddManager(names)
+        root = self.build(manager, " | ".join(f"(y{i} & z{i})" for i in range(6)))
+        self.assertEqual(manager.size(root), 2 ** 7)
+        sifted, [new_root] = manager.sift([root])
+        self.assertEqual(sifted.size(new_root), 14)
+        self.assertEqual(sifted.sat_count(new_root), manager.sat_count(root))
+
+
+if __name__ == "__main__":
+    unittest.main()
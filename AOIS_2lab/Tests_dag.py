@@ -0,0 +1,37 @@
+import unittest
+from Expression_dag import DagNode, ExpressionDag
+from Logic_solver import LogicSolver
+from Table_generate import TruthTableGenerator
+
+
+class TestExpressionDag(unittest.TestCase):
+
+    def test_hash_consing(self):
+        dag, root = ExpressionDag.from_rpn(['a', 'b', '&', 'b', 'a', '&', '|'])
+        # a, b, (a & b) и корень: b & a совпадает с a & b
+        self.assertEqual(len(dag), 4)
+        self.assertEqual(dag.nodes[root], DagNode('|', (2, 2)))
+        self.assertEqual(dag.to_infix(root), '((a & b) | (a & b))')
+
+    def test_implication_is_not_commutative(self):
+        dag, _ = ExpressionDag.from_rpn(['a', 'b', '->', 'b', 'a', '->', '&'])
+        self.assertEqual(len(dag.operator_nodes()), 3)
+
+    def test_shared_columns(self):
+        generator = TruthTableGenerator("(a & b) | !(b & a)")
+        self.assertEqual(generator.subexpression_strings, ['(a & b)', '!(a & b)', '((a & b) | !(a & b))'])
+        for values, subs, result in generator.generate_truth_table():
+            self.assertEqual(len(subs), 3)
+            self.assertTrue(result)
+
+    def test_solver_evaluates_shared_node_once(self):
+        solver = LogicSolver(['a', 'b', '&', 'a', 'b', '&', '~'])
+        self.assertEqual(solver.steps_function(True, False), (False, True, True))
+
+    def test_deep_infix(self):
+        dag, root = ExpressionDag.from_rpn(['a'] + ['!'] * 5000)
+        self.assertEqual(len(dag.to_infix(root)), 5001)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from Validator import LogicalExpressionChecker
+from rpn_converter import ReversePolishNotationConverter
+from Logic_solver import LogicSolver
+from Symbol_table import SymbolTable
+from Table_generate import TruthTableGenerator
+
+
+class TestIdentifiers(unittest.TestCase):
+
+    def test_tokenize(self):
+        self.assertEqual(LogicalExpressionChecker.tokenize("carry_in&!x17->(y ~ z)"),
+                         ['carry_in', '&', '!', 'x17', '->', '(', 'y', '~', 'z', ')'])
+        with self.assertRaises(ValueError):
+            LogicalExpressionChecker.tokenize("a + b")
+        with self.assertRaises(ValueError):
+            LogicalExpressionChecker.tokenize("17x & a")
+
+    def test_rpn(self):
+        converter = ReversePolishNotationConverter()
+        self.assertEqual(converter.transform("x1 | !x2 & x10"), ['x1', 'x2', '!', 'x10', '&', '|'])
+        restricted = ReversePolishNotationConverter(allowed_vars={'a', 'b'})
+        with self.assertRaises(ValueError):
+            restricted.transform("a & c")
+
+    def test_symbol_table(self):
+        symbols = SymbolTable.from_tokens(['x10', 'x2', 'carry', 'x2'])
+        self.assertEqual(list(symbols), ['carry', 'x2', 'x10'])
+        self.assertEqual(symbols.index('x10'), 2)
+        self.assertEqual(symbols[1], 'x2')
+        self.assertEqual(symbols.add('y'), 3)
+        self.assertNotIn('z', symbols)
+        with self.assertRaises(ValueError):
+            symbols.index('z')
+
+    def test_solver_with_symbol_table(self):
+        symbols = SymbolTable(['if', 'not'])
+        solver = LogicSolver(['if', 'not', '&'], symbols)
+        self.assertTrue(solver.compute({'if': True, 'not': True}))
+
+    def test_generator(self):
+        generator = TruthTableGenerator("carry_in & (x2 | x10)")
+        self.assertEqual(generator.variables, ['carry_in', 'x2', 'x10'])
+        self.assertEqual(generator.compute_index_form()["binary"], '00000111')
+        self.assertEqual(generator.subexpression_strings, ['(x2 | x10)', '(carry_in & (x2 | x10))'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from Expression_parser import BinaryOp, Not, Var, parse_expression
+from Validator import LogicalExpressionChecker
+from rpn_converter import ReversePolishNotationConverter
+
+
+class TestExpressionParser(unittest.TestCase):
+
+    def test_rpn_and_ast(self):
+        parsed = parse_expression("!a | (b -> c)")
+        self.assertEqual(parsed.rpn, ('a', '!', 'b', 'c', '->', '|'))
+        self.assertEqual(parsed.ast, BinaryOp('|', Not(Var('a')), BinaryOp('->', Var('b'), Var('c'))))
+        self.assertEqual(list(parsed.symbols), ['a', 'b', 'c'])
+
+    def test_unary_does_not_pop(self):
+        self.assertEqual(parse_expression("!!a").rpn, ('a', '!', '!'))
+        self.assertEqual(parse_expression("a ~ !b").rpn, ('a', 'b', '!', '~'))
+
+    def test_error_positions(self):
+        cases = {
+            "a & & b": "позиции 5",
+            "a b": "позиции 3",
+            "(a & b": "позиции 1",
+            "a & b)": "позиции 6",
+            "a + b": "позиции 3",
+        }
+        for expression, message in cases.items():
+            with self.assertRaises(ValueError) as context:
+                parse_expression(expression)
+            self.assertIn(message, str(context.exception))
+        with self.assertRaises(ValueError):
+            parse_expression("a &")
+
+    def test_frontends_share_parse(self):
+        self.assertTrue(LogicalExpressionChecker.is_valid("a -> b"))
+        with self.assertRaises(ValueError):
+            LogicalExpressionChecker.is_valid("a & b |")
+        self.assertEqual(ReversePolishNotationConverter().transform("a & b | c"), ['a', 'b', '&', 'c', '|'])
+        self.assertIs(parse_expression("a & b | c"), parse_expression("a & b | c"))
+
+    def test_custom_precedence_table(self):
+        converter = ReversePolishNotationConverter(operator_precedence={'&': 2, '|': 3, '->': 1, '~': 1, '!': 4})
+        self.assertEqual(converter.transform("a & b | c"), ['a', 'b', 'c', '|', '&'])
+        missing = {"!a & b": "'!' в позиции 1", "a | b & c": "'&' в позиции 7"}
+        for expression, message in missing.items():
+            with self.assertRaises(ValueError) as context:
+                ReversePolishNotationConverter(operator_precedence={'|': 2, '->': 1, '~': 4}).transform(expression)
+            self.assertIn(message, str(context.exception))
+        with self.assertRaises(ValueError):
+            parse_expression("a & b", {'&': 3, '^': 2})
+
+    def test_long_expression(self):
+        expression = " & ".join(f"x{i}" for i in range(20000))
+        parsed = parse_expression(expression)
+        self.assertEqual(len(parsed.rpn), 39999)
+        self.assertEqual(len(parsed.symbols), 20000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import io
+import unittest
+from Table_generate import TruthTableGenerator
+from Truth_table_processor import IndexSet, TruthTableProcessor
+
+
+class TestStreamingNormalForms(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = TruthTableGenerator("a -> b")
+        self.processor = TruthTableProcessor(self.generator.generate_truth_table(), self.generator.variables)
+
+    def test_normal_forms_compatible(self):
+        forms = self.processor.get_normal_forms()
+        self.assertEqual(forms["СДНФ"], "(!a & !b) | (!a & b) | (a & b)")
+        self.assertEqual(forms["СКНФ"], "(!a | b)")
+        self.assertEqual(forms["СДНФ Индексы"], [0, 1, 3])
+        self.assertEqual(forms["СКНФ Индексы"], [2])
+
+    def test_row_list_input(self):
+        table = list(self.generator.generate_truth_table())
+        forms = TruthTableProcessor(table, self.generator.variables).get_normal_forms()
+        self.assertEqual(forms, self.processor.get_normal_forms())
+
+    def test_write_streams(self):
+        stream = io.StringIO()
+        self.assertEqual(self.processor.write_sdnf(stream), 3)
+        self.assertEqual(stream.getvalue(), "(!a & !b) | (!a & b) | (a & b)")
+        stream = io.StringIO()
+        TruthTableProcessor(TruthTableGenerator("a | !a").generate_truth_table(), ['a']).write_sknf(stream)
+        self.assertEqual(stream.getvalue(), "False")
+
+    def test_index_set(self):
+        indices = IndexSet(0b1110_0101, 8)
+        self.assertEqual(list(indices), [0, 1, 2, 5, 7])
+        self.assertEqual(list(indices.runs()), [(0, 3), (5, 1), (7, 1)])
+        self.assertEqual(len(indices), 5)
+        self.assertIn(5, indices)
+        self.assertNotIn(4, indices)
+        self.assertEqual(list(indices.complement()), [3, 4, 6])
+        self.assertEqual(repr(indices), "IndexSet([0-2, 5, 7], size=8)")
+
+    def test_terms_for_odd_variable_count(self):
+        generator = TruthTableGenerator("a & b & c")
+        processor = TruthTableProcessor(generator.generate_truth_table(), generator.variables)
+        self.assertEqual(list(processor.iter_sdnf_terms()), ["(a & b & c)"])
+        self.assertEqual(next(processor.iter_sknf_terms()), "(a | b | c)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import io
+import unittest
+from Sat_solver import CdclSolver, SatChecker, TseitinEncoder, luby
+from Logic_solver import LogicSolver
+from rpn_converter import ReversePolishNotationConverter
+
+
+class TestSatSolver(unittest.TestCase):
+
+    def test_luby_sequence(self):
+        self.assertEqual([luby(i) for i in range(1, 16)], [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8])
+
+    def test_model_satisfies_expression(self):
+        expression = "(a -> b) & (b -> c) & a & !(c & d)"
+        model = SatChecker.satisfiable(expression)
+        rpn = ReversePolishNotationConverter().transform(expression)
+        self.assertTrue(LogicSolver(rpn).compute(model))
+        self.assertIsNone(SatChecker.satisfiable("(a | b) & !a & !b"))
+
+    def test_tautology_and_equivalence(self):
+        self.assertTrue(SatChecker.is_tautology("(a -> b) ~ (!b -> !a)"))
+        self.assertFalse(SatChecker.is_tautology("a -> b"))
+        self.assertTrue(SatChecker.are_equivalent("!(a & b)", "!a | !b"))
+        self.assertFalse(SatChecker.are_equivalent("a -> b", "b -> a"))
+
+    def test_hundreds_of_variables(self):
+        chain = " & ".join(f"(x{i} -> x{i + 1})" for i in range(300))
+        self.assertTrue(SatChecker.is_tautology(f"({chain}) -> (x0 -> x300)"))
+        pairs = " | ".join(f"(y{i} & z{i})" for i in range(150))
+        dual = "!(" + " & ".join(f"(!y{i} | !z{i})" for i in range(150)) + ")"
+        self.assertTrue(SatChecker.are_equivalent(pairs, dual))
+
+    def test_pigeonhole_is_unsatisfiable(self):
+        # 6 голубей в 5 клетках: классический трудный для резолюции пример
+        holes = range(5)
+        parts = ["(" + " | ".join(f"p{i}_{j}" for j in holes) + ")" for i in range(6)]
+        parts += [f"!(p{i}_{j} & p{k}_{j})" for j in holes for i in range(6) for k in range(i + 1, 6)]
+        self.assertIsNone(SatChecker.satisfiable(" & ".join(parts)))
+
+    def test_dimacs_round_trip(self):
+        encoder = TseitinEncoder()
+        root = encoder.encode("a & (b | !c)")
+        stream = io.StringIO()
+        encoder.write_dimacs(stream, [root])
+        self.assertIn("p cnf 5 7\n", stream.getvalue())
+        stream.seek(0)
+        solver = CdclSolver.from_dimacs(stream)
+        self.assertTrue(solver.solve())
+        model = solver.model()
+        self.assertTrue(model[encoder.names['a']])
+        self.assertTrue(model[encoder.names['b']] or not model[encoder.names['c']])
+
+    def test_dimacs_validation(self):
+        with self.assertRaises(ValueError):
+            CdclSolver.from_dimacs(io.StringIO("p cnf 2 1\n3 0\n"))
+        with self.assertRaises(ValueError):
+            CdclSolver.from_dimacs(io.StringIO("1 -2 0\n"))
+        with self.assertRaises(ValueError):
+            CdclSolver.from_dimacs(io.StringIO("c пусто\n"))
+        with self.assertRaises(ValueError):
+            CdclSolver(2, [[1, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from Bdd_manager import TRUE, BddManager
+from rpn_converter import ReversePolishNotationConverter
+from Simplifier import simplify
+from Table_generate import TruthTableGenerator
+
+
+class TestSimplifier(unittest.TestCase):
+
+    def setUp(self):
+        self.converter = ReversePolishNotationConverter()
+
+    def simplified(self, expression):
+        return list(simplify(self.converter.transform(expression)).rpn)
+
+    def test_rules(self):
+        self.assertEqual(self.simplified("!!a"), ['a'])
+        self.assertEqual(self.simplified("a & a"), ['a'])
+        self.assertEqual(self.simplified("a | !a"), ['1'])
+        self.assertEqual(self.simplified("a & !a | b"), ['b'])
+        self.assertEqual(self.simplified("a & (a | b)"), ['a'])
+        self.assertEqual(self.simplified("a | (b | a)"), ['b', 'a', '|'])
+        self.assertEqual(self.simplified("!a -> b"), ['a', 'b', '|'])
+        self.assertEqual(self.simplified("a -> !a"), ['a', '!'])
+        self.assertEqual(self.simplified("!a ~ !b"), ['a', 'b', '~'])
+        self.assertEqual(self.simplified("(a -> a) ~ b"), ['b'])
+
+    def test_node_count_reported(self):
+        generator = TruthTableGenerator("!!(a & !b) | (a & !b) | c & !c", presimplify=True)
+        self.assertEqual((generator.simplification.nodes_before, generator.simplification.nodes_after), (8, 2))
+        self.assertEqual(generator.rpn_expr, ['a', 'b', '!', '&'])
+        self.assertEqual(generator.variables, ['a', 'b', 'c'])
+        self.assertIsNone(TruthTableGenerator("a & b").simplification)
+
+    def test_toggling_presimplify_resets_cache(self):
+        generator = TruthTableGenerator("a & a | b & !b")
+        self.assertEqual(len(generator.evaluate_columns()), 5)
+        generator.presimplify = True
+        self.assertEqual(generator.rpn_expr, ['a'])
+        self.assertEqual(generator.evaluate_columns(), (0b0011,))
+        generator.presimplify = False
+        self.assertIsNone(generator.simplification)
+        self.assertEqual(len(generator.evaluate_columns()), 5)
+
+    def test_table_unchanged(self):
+        expression = "(a -> !!b) & (a | !a) | (c ~ c) & !(b & b) -> (a -> a)"
+        plain = TruthTableGenerator(expression)
+        simplified = TruthTableGenerator(expression, presimplify=True)
+        self.assertEqual(simplified.compute_index_form(), plain.compute_index_form())
+        self.assertEqual(simplified.compute_index_form()["binary"], "11111111")
+        self.assertEqual(list(simplified.generate_truth_table())[0], ({'a': False, 'b': False, 'c': False}, [], True))
+        manager, root = simplified.bdd()
+        self.assertEqual(root, TRUE)
+
+    def test_bdd_accepts_constants(self):
+        manager = BddManager()
+        self.assertEqual(manager.from_rpn(['0', '!', 'a', '|']), TRUE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import itertools
+import unittest
+from Logic_solver import LogicSolver
+from Table_generate import TruthTableGenerator
+
+
+class TestCompiledSolver(unittest.TestCase):
+
+    def test_compute(self):
+        solver = LogicSolver(['a', '!', 'b', 'c', '&', '|'])
+        self.assertEqual(solver.variables, ('a', 'b', 'c'))
+        self.assertTrue(solver.compute({'a': False, 'b': True, 'c': True}))
+        self.assertFalse(solver.function(True, True, False))
+
+    def test_operators(self):
+        expected = {'&': lambda x, y: x and y, '|': lambda x, y: x or y,
+                    '->': lambda x, y: not x or y, '~': lambda x, y: x == y}
+        for operator, reference in expected.items():
+            solver = LogicSolver(['a', 'b', operator])
+            for a, b in itertools.product([False, True], repeat=2):
+                self.assertEqual(solver.function(a, b), reference(a, b))
+
+    def test_compiled_function_is_cached(self):
+        self.assertIs(LogicSolver(['a', 'b', '&']).function, LogicSolver(['a', 'b', '&']).function)
+
+    def test_steps_function(self):
+        solver = LogicSolver(['a', 'b', '!', '&'])
+        self.assertEqual(solver.steps_function(True, False), (True, True, True))
+        self.assertEqual(LogicSolver(['a']).steps_function(True), (True,))
+
+    def test_deep_expression(self):
+        # Сгенерированный код не вложенный, поэтому глубина выражения не ограничена парсером Python
+        solver = LogicSolver(['a'] + ['!'] * 1001)
+        self.assertTrue(solver.function(False))
+
+    def test_unknown_variable(self):
+        with self.assertRaises(ValueError):
+            LogicSolver(['a', 'b', '&'], variables=['a'])
+
+    def test_table_rows(self):
+        table = TruthTableGenerator("a & !b").generate_truth_table()
+        self.assertEqual(table[2], ({'a': True, 'b': False}, [True, True], True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import itertools
+import os
+import tempfile
+import unittest
+from Logic_solver import LogicSolver
+from Table_generate import TruthTableGenerator
+from Truth_table import TruthTable, evaluate_sharded, variable_slices
+
+
+class TestBitSlicedTable(unittest.TestCase):
+
+    def test_variable_slices_match_product_order(self):
+        count = 4
+        slices = variable_slices(count)
+        size = 1 << count
+        for row, values in enumerate(itertools.product([False, True], repeat=count)):
+            bits = tuple(bool((column >> (size - 1 - row)) & 1) for column in slices)
+            self.assertEqual(bits, values)
+
+    def test_slice_function(self):
+        # a -> b по строкам 00, 01, 10, 11 равно 1101
+        solver = LogicSolver(['a', 'b', '->'])
+        self.assertEqual(solver.slice_function(*variable_slices(2), 0b1111), (0b1101, 0b1101))
+        self.assertEqual(LogicSolver(['a', '!']).slice_function(0b01, 0b11), (0b10, 0b10))
+
+    def test_lazy_rows(self):
+        table = TruthTable(['a', 'b'], [0b0110], 0b1001)
+        self.assertEqual(len(table), 4)
+        self.assertIsNone(table._bits)
+        self.assertEqual(table[1], ({'a': False, 'b': True}, [True], False))
+        self.assertEqual(table[-1], ({'a': True, 'b': True}, [False], True))
+        self.assertEqual(list(table), table[:])
+
+    def test_generator_matches_rowwise_evaluation(self):
+        generator = TruthTableGenerator("(a -> b) & !(c ~ a) | b")
+        solver = LogicSolver(generator.rpn_expr, generator.variables)
+        for values, _, result in generator.generate_truth_table():
+            self.assertEqual(result, solver.compute(values))
+
+    def test_index_form(self):
+        self.assertEqual(TruthTableGenerator("a & b | !c").compute_index_form(),
+                         {"binary": "10101011", "decimal": 171})
+
+    def test_write_result_in_blocks(self):
+        generator = TruthTableGenerator("(a -> b) & (c | !d) ~ e | f & !g")
+        index_form = generator.compute_index_form()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "result.bin")
+            # 7 переменных блоками по 8 строк — 16 блоков
+            ones = generator.write_result(path, block_bits=3)
+            with open(path, 'rb') as file:
+                data = file.read()
+        self.assertEqual(data, index_form["decimal"].to_bytes(16, 'big'))
+        self.assertEqual(ones, index_form["binary"].count('1'))
+
+    def test_write_result_smaller_than_byte(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "result.bin")
+            TruthTableGenerator("a -> b").write_result(path)
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), bytes([0b11010000]))
+
+    def test_sharded_evaluation_matches_columns(self):
+        expression = "(a -> b) & (c | !d) ~ e | f & !g ~ (h | i)"
+        expected = TruthTableGenerator(expression).evaluate_columns()[-1]
+        self.assertEqual(TruthTableGenerator(expression).result_column(workers=2), expected)
+        self.assertEqual(evaluate_sharded(["a", "b", "->"], ["a", "b"], workers=2), 0b1101)
+        generator = TruthTableGenerator(expression)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "result.bin")
+            ones = generator.write_result(path, block_bits=4, workers=2)
+            with open(path, 'rb') as file:
+                self.assertEqual(int.from_bytes(file.read(), 'big'), expected)
+        self.assertEqual(ones, expected.bit_count())
+
+    def test_all_letters_allowed(self):
+        generator = TruthTableGenerator("x & !z")
+        self.assertEqual(generator.variables, ['x', 'z'])
+
+    def test_results_are_cached(self):
+        generator = TruthTableGenerator("a -> b")
+        self.assertIs(generator.generate_truth_table(), generator.generate_truth_table())
+        self.assertIs(generator.evaluate_columns(), generator.evaluate_columns())
+        self.assertEqual(generator.minterms(), (0, 1, 3))
+        self.assertEqual(generator.maxterms(), (2,))
+        # Изменение возвращённого словаря не портит кеш
+        generator.compute_index_form()["binary"] = "x"
+        self.assertEqual(generator.compute_index_form()["binary"], "1101")
+
+    def test_cache_invalidated_on_new_expression(self):
+        generator = TruthTableGenerator("a -> b")
+        table = generator.generate_truth_table()
+        generator.expression = "a & b & c"
+        self.assertIsNot(generator.generate_truth_table(), table)
+        self.assertEqual(generator.variables, ['a', 'b', 'c'])
+        self.assertEqual(generator.minterms(), (7,))
+        with self.assertRaises(ValueError):
+            generator.expression = "a &"
+        self.assertEqual(generator.expression, "a & b & c")
+
+
+if __name__ == "__main__":
+    unittest.main()
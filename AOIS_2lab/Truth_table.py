@@ -0,0 +1,162 @@
+import itertools
+import mmap
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from Logic_solver import LogicSolver
+
+# Блок по умолчанию — 2^16 строк: столбец блока (8 КБ) остаётся в кеше процессора
+BLOCK_BITS = 16
+
+
+@lru_cache(maxsize=8)
+def variable_slices(count):
+    """Битовые срезы переменных для таблицы из 2^count строк.
+
+    Строка r хранится в бите 2^count - 1 - r (строка 0 — старший бит), порядок строк
+    совпадает с itertools.product([False, True], repeat=count): первая переменная — старшая.
+    Поэтому столбец результата, записанный в двоичном виде, — это сразу индексная форма.
+    """
+    size = 1 << count
+    mask = (1 << size) - 1
+    slices = []
+    for position in range(count):
+        half = 1 << (count - 1 - position)
+        # В номере бита p разряд k = count-1-position равен 1 там, где в номере строки он 0
+        pattern = ((1 << half) - 1) << half
+        # Повтор периода удвоением: log(size) сдвигов вместо деления длинных чисел
+        width = 2 * half
+        while width < size:
+            pattern |= pattern << width
+            width <<= 1
+        slices.append(mask ^ pattern)
+    return tuple(slices)
+
+
+class TruthTable:
+    """Ленивая таблица истинности поверх столбцов-срезов.
+
+    Строки (значения переменных, значения подвыражений, результат) собираются только
+    при обращении к ним, поэтому таблица занимает по одному длинному целому на столбец.
+    """
+
+    def __init__(self, variables, sub_columns, result_column):
+        self.variables = list(variables)
+        self.sub_columns = tuple(sub_columns)
+        self.result_column = result_column
+        self.size = 1 << len(self.variables)
+        self._bits = None
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Номер строки вне таблицы")
+        count = len(self.variables)
+        values = {name: bool((index >> (count - 1 - position)) & 1) for position, name in enumerate(self.variables)}
+        sub_bits, result_bits = self._column_bits()
+        return values, [bits[index] == '1' for bits in sub_bits], result_bits[index] == '1'
+
+    def __iter__(self):
+        sub_bits, result_bits = self._column_bits()
+        # Без подвыражений zip(*sub_bits) пуст и оборвал бы перебор строк
+        subs_by_row = zip(*sub_bits) if sub_bits else itertools.repeat(())
+        rows = zip(itertools.product([False, True], repeat=len(self.variables)), subs_by_row, result_bits)
+        for values, subs, result in rows:
+            yield dict(zip(self.variables, values)), [bit == '1' for bit in subs], result == '1'
+
+    def _column_bits(self):
+        """Столбцы как строки '0'/'1' в порядке строк таблицы (строятся один раз)"""
+        if self._bits is None:
+            width = f'0{self.size}b'
+            self._bits = ([format(column, width) for column in self.sub_columns],
+                          format(self.result_column, width))
+        return self._bits
+
+
+def evaluate_block(rpn_expr, variables, block_bits, block):
+    """Столбец результата для блока из 2^block_bits строк, в котором старшие переменные
+    равны двоичной записи номера block; возвращает (число единиц, упакованные байты).
+
+    Принимает ОПН, а не скомпилированную функцию: так блок можно передать в другой
+    процесс, а каждый процесс компилирует выражение один раз (кеш _compile).
+    """
+    evaluate = LogicSolver(rpn_expr, variables).bitwise_function
+    high_count = len(variables) - block_bits
+    block_rows = 1 << block_bits
+    mask = (1 << block_rows) - 1
+    block_bytes = (block_rows + 7) // 8
+    # Старшие переменные в пределах блока постоянны: их срезы — 0 или маска
+    high_slices = [mask if (block >> (high_count - 1 - position)) & 1 else 0 for position in range(high_count)]
+    result = evaluate(*high_slices, *variable_slices(block_bits), mask)
+    # Блок меньше байта дополняется нулями справа
+    return result.bit_count(), (result << (block_bytes * 8 - block_rows)).to_bytes(block_bytes, 'big')
+
+
+def iter_blocks(rpn_expr, variables, block_bits, workers=None):
+    """Результаты evaluate_block по всем блокам в порядке строк.
+
+    При workers > 1 блоки вычисляются в пуле из workers процессов, порядок сохраняется.
+    Задача — один блок, и одновременно в работе не больше 2 * workers блоков,
+    поэтому память и в процессах, и здесь ограничена размером блока.
+    """
+    rpn_expr, variables = tuple(rpn_expr), tuple(variables)
+    blocks = range(1 << (len(variables) - block_bits))
+    if not workers or workers == 1 or len(blocks) == 1:
+        for block in blocks:
+            yield evaluate_block(rpn_expr, variables, block_bits, block)
+        return
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for block in blocks:
+            pending.append(executor.submit(evaluate_block, rpn_expr, variables, block_bits, block))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def evaluate_sharded(rpn_expr, variables, workers, shard_bits=None):
+    """Столбец результата (как в evaluate_columns), посчитанный по частям в workers процессах.
+
+    Таблица делится на 2^shard_bits частей фиксацией старших shard_bits переменных;
+    по умолчанию частей примерно вчетверо больше, чем процессов, чтобы их загрузка
+    выравнивалась. Упакованные части склеиваются в одно целое.
+    """
+    count = len(variables)
+    if shard_bits is None:
+        shard_bits = (4 * workers - 1).bit_length()
+    # Часть не меньше байта, иначе байты частей не стыкуются
+    block_bits = count if count < 3 else max(count - shard_bits, 3)
+    data = b''.join(part for _, part in iter_blocks(rpn_expr, variables, block_bits, workers))
+    return int.from_bytes(data, 'big') >> (len(data) * 8 - (1 << count))
+
+
+def evaluate_to_file(solver, path, block_bits=BLOCK_BITS, workers=None):
+    """Вычисляет столбец результата по блокам из 2^block_bits строк и пишет его в файл.
+
+    Файл — упакованный битовый вектор: строка r — бит 7 - r % 8 байта r // 8, то есть
+    содержимое файла совпадает с индексной формой. Память ограничена размером блока
+    при любом числе переменных; при workers > 1 блоки считаются в пуле процессов.
+    Возвращает количество строк, на которых выражение истинно.
+    """
+    count = len(solver.variables)
+    # Блок не меньше байта (8 строк), иначе блоки не стыкуются по границам байтов
+    block_bits = min(max(block_bits, 3), count)
+    block_bytes = ((1 << block_bits) + 7) // 8
+
+    ones = 0
+    size = block_bytes << (count - block_bits)
+    with open(path, 'w+b') as file:
+        file.truncate(size)
+        with mmap.mmap(file.fileno(), size) as output:
+            blocks = iter_blocks(solver.rpn_expr, solver.variables, block_bits, workers)
+            for block, (block_ones, data) in enumerate(blocks):
+                ones += block_ones
+                output[block * block_bytes:(block + 1) * block_bytes] = data
+    return ones
@@ -1,30 +1,131 @@
+import re
+
+_RUN = re.compile('1+')
+
+
+class IndexSet:
+    """Множество номеров строк таблицы как битовая маска на size строк.
+
+    Строка i хранится в бите size - 1 - i (как столбцы таблицы и индексная форма),
+    поэтому набор занимает size бит, а не список целых. Перебор идёт по возрастанию.
+    """
+
+    __slots__ = ('bits', 'size')
+
+    def __init__(self, bits, size):
+        self.bits = bits
+        self.size = size
+
+    def complement(self):
+        return IndexSet(self.bits ^ ((1 << self.size) - 1), self.size)
+
+    def runs(self):
+        """Сжатие длин серий: пары (первый номер, длина) подряд идущих номеров"""
+        for match in _RUN.finditer(self._binary()):
+            yield match.start(), match.end() - match.start()
+
+    def _binary(self):
+        return format(self.bits, f'0{self.size}b')
+
+    def __iter__(self):
+        binary = self._binary()
+        index = binary.find('1')
+        while index != -1:
+            yield index
+            index = binary.find('1', index + 1)
+
+    def __contains__(self, index):
+        return 0 <= index < self.size and bool((self.bits >> (self.size - 1 - index)) & 1)
+
+    def __len__(self):
+        return self.bits.bit_count()
+
+    def __eq__(self, other):
+        if isinstance(other, IndexSet):
+            return self.bits == other.bits and self.size == other.size
+        return NotImplemented
+
+    def __repr__(self):
+        runs = ", ".join(str(start) if length == 1 else f"{start}-{start + length - 1}"
+                         for start, length in self.runs())
+        return f"IndexSet([{runs}], size={self.size})"
+
+
 class TruthTableProcessor:
     def __init__(self, truth_table, variables):
         self.truth_table = truth_table
         self.variables = variables
+        self._minterms = None
 
-    def get_normal_forms(self):
-        sknf_terms = []
-        sdnf_terms = []
-        sknf_indices = []
-        sdnf_indices = []
-
-        for index, (values, _, result) in enumerate(self.truth_table):
-            term = []
-            if result:  # Если результат 1, добавляем в СДНФ
-                sdnf_indices.append(index)
-                for var in self.variables:
-                    term.append(var if values[var] else f"!{var}")
-                sdnf_terms.append(f"({' & '.join(term)})")
-            else:  # Если результат 0, добавляем в СКНФ
-                sknf_indices.append(index)
-                for var in self.variables:
-                    term.append(f"!{var}" if values[var] else var)
-                sknf_terms.append(f"({' | '.join(term)})")
+    def get_index_sets(self):
+        """Номера строк СДНФ и СКНФ как IndexSet (без списков целых)"""
+        if self._minterms is None:
+            size = 1 << len(self.variables)
+            result_column = getattr(self.truth_table, 'result_column', None)
+            if result_column is None:
+                # Обычный список строк: столбец результата собирается одним проходом
+                result_column = int(''.join('1' if result else '0' for _, _, result in self.truth_table), 2)
+            self._minterms = IndexSet(result_column, size)
+        return {"СДНФ": self._minterms, "СКНФ": self._minterms.complement()}
+
+    def iter_sdnf_terms(self):
+        """Термы СДНФ по одному, без построения всей формы в памяти"""
+        return self._iter_terms(self.get_index_sets()["СДНФ"], " & ", positive=True)
+
+    def iter_sknf_terms(self):
+        return self._iter_terms(self.get_index_sets()["СКНФ"], " | ", positive=False)
 
+    def write_sdnf(self, stream):
+        """Пишет СДНФ в файловый объект по мере построения термов; возвращает число термов"""
+        return self._write_form(stream, self.iter_sdnf_terms(), " | ", "True")
+
+    def write_sknf(self, stream):
+        return self._write_form(stream, self.iter_sknf_terms(), " & ", "False")
+
+    def get_normal_forms(self):
+        index_sets = self.get_index_sets()
+        sdnf_terms = list(self.iter_sdnf_terms())
+        sknf_terms = list(self.iter_sknf_terms())
         return {
             "СКНФ": " & ".join(sknf_terms) if sknf_terms else "False",
             "СДНФ": " | ".join(sdnf_terms) if sdnf_terms else "True",
-            "СКНФ Индексы": sknf_indices,
-            "СДНФ Индексы": sdnf_indices
+            "СКНФ Индексы": list(index_sets["СКНФ"]),
+            "СДНФ Индексы": list(index_sets["СДНФ"])
         }
+
+    def _iter_terms(self, indices, joiner, positive):
+        # Литералы старшей и младшей половин переменных заготавливаются для всех наборов:
+        # терм строки — склейка двух готовых строк, а не n литералов
+        count = len(self.variables)
+        high_count = count // 2
+        low_count = count - high_count
+        high = self._literal_table(self.variables[:high_count], joiner, positive)
+        low = self._literal_table(self.variables[high_count:], joiner, positive)
+        low_mask = (1 << low_count) - 1
+        if not high_count:
+            for index in indices:
+                yield f"({low[index]})"
+            return
+        for index in indices:
+            yield f"({high[index >> low_count]}{joiner}{low[index & low_mask]})"
+
+    @staticmethod
+    def _literal_table(variables, joiner, positive):
+        """Для каждого набора значений variables — строка литералов, соединённых joiner"""
+        table = ['']
+        for name in variables:
+            # В СДНФ единице соответствует переменная, в СКНФ — её отрицание
+            one, zero = (name, f"!{name}") if positive else (f"!{name}", name)
+            table = [f"{prefix}{joiner}{literal}" if prefix else literal
+                     for prefix in table for literal in (zero, one)]
+        return table
+
+    @staticmethod
+    def _write_form(stream, terms, joiner, empty):
+        count = 0
+        for term in terms:
+            stream.write(joiner + term if count else term)
+            count += 1
+        if not count:
+            stream.write(empty)
+        return count
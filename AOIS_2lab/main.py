@@ -1,5 +1,3 @@
-from Validator import LogicalExpressionChecker
-from rpn_converter import ReversePolishNotationConverter  # Используем новый конвертер
 from Truth_table_processor import TruthTableProcessor
 from Table_generate import TruthTableGenerator
 
@@ -8,30 +6,22 @@ def main():
     # Получаем выражение от пользователя
     expression = input("Введите логическое выражение: ").strip()
 
-    # Первичная валидация выражения
+    # Выражение разбирается и проверяется один раз, все этапы используют этот разбор
     try:
-        LogicalExpressionChecker.is_valid(expression)
+        truth_gen = TruthTableGenerator(expression)
     except ValueError as e:
         print(f"Ошибка в выражении: {e}")
         return
 
     try:
-        # Дополнительная проверка (можно убрать дублирование)
-        LogicalExpressionChecker.is_valid(expression)
-
-        # Создаем генератор таблицы истинности
-        truth_gen = TruthTableGenerator(expression)
-
         # Выводим таблицу истинности
         print("\nТаблица истинности:")
         truth_gen.display_table()
 
-        # Конвертируем в обратную польскую запись
-        rpn_converter = ReversePolishNotationConverter()
-        rpn_expression = rpn_converter.transform(expression)  # Используем новый метод
-        print(f"\nОбратная польская нотация: {' '.join(rpn_expression)}")
+        # Обратная польская запись уже получена при разборе
+        print(f"\nОбратная польская нотация: {' '.join(truth_gen.rpn_expr)}")
 
-        # Генерируем полную таблицу истинности для анализа
+        # Таблица уже построена при выводе и берётся из кеша генератора
         truth_table = truth_gen.generate_truth_table()
 
         # Анализируем нормальные формы
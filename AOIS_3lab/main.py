@@ -6,7 +6,6 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'A
 # Добавляем папку AOIS_2 для Logic_minimizer и других модулей
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__))))
 
-from AOIS_2lab.Validator import LogicalExpressionChecker
 from AOIS_2lab.Truth_table_processor import TruthTableProcessor
 from AOIS_2lab.Table_generate import TruthTableGenerator
 from Logic_minimizer import LogicMinimizer
@@ -15,14 +14,14 @@ from Logic_minimizer import LogicMinimizer
 def main():
     expression = input("Введите логическое выражение: ").strip()
 
+    # Генератор разбирает выражение один раз и запоминает таблицу для всех этапов ниже
     try:
-        LogicalExpressionChecker.is_valid(expression)
+        truth_gen = TruthTableGenerator(expression)
     except ValueError as e:
         print(f"Ошибка в выражении: {e}")
         return
 
     try:
-        truth_gen = TruthTableGenerator(expression)
         print("\nТаблица истинности:")
         truth_gen.display_table()
 
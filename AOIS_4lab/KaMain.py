@@ -1,5 +1,11 @@
+import os
+import sys
 from karnaugh_template import KarnaughMapProcessor, TruthTableData
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'AOIS_1lab')))
+from constans import BCD_8421
+from B_codes import CodeConverter
+
 
 ODS_3_truth_table = \
     [
@@ -10,25 +16,8 @@ ODS_3_truth_table = \
         [0, 0, 0, 1, 0, 1, 1, 1],  # P_i+1 perenos to the next
     ]
 
-D8421_plus_5_truth_table = [
-    [0, 0, 0, 0, 0, 1, 0, 1],  # 0 +5=5  → 0101
-    [0, 0, 0, 1, 0, 1, 1, 0],  # 1 +5=6 → 0110
-    [0, 0, 1, 0, 0, 1, 1, 1],  # 2 +5=7 → 0111
-    [0, 0, 1, 1, 1, 0, 0, 0],  # 3 +5=8 → 1000
-    [0, 1, 0, 0, 1, 0, 0, 1],  # 4 +5=9 →
-    [0, 1, 0, 1, 0, 0, 0, 0],  # 5 +5=0 →
-    [0, 1, 1, 0, 0, 0, 0, 1],  # 6 +5=1 →
-    [0, 1, 1, 1, 0, 0, 1, 0],  # 7 +5=2 →
-    [1, 0, 0, 0, 0, 0, 1, 1],  # 8 +5=3 →
-    [1, 0, 0, 1, 0, 1, 0, 0],  # 9 +5=14 →
-
-    [1, 0, 1, 0, 0, 0, 0, 0],  # 10 +5=15 →
-    [1, 0, 1, 1, 0, 0, 0, 0],  # 11 +5=16 →
-    [1, 1, 0, 0, 0, 0, 0, 0],  # 12 +5=17 →
-    [1, 1, 0, 1, 0, 0, 0, 0],  # 13 +5=18 →
-    [1, 1, 1, 0, 0, 0, 0, 0],  # 14 +5=19 →  (mod16)
-    [1, 1, 1, 1, 0, 0, 0, 0],  # 15 +5=20 →
-]
+# Д8421+5: цифра d в коде 8421 -> (d + 5) mod 10 в коде 8421; тетрады 10..15 не являются цифрами
+D8421_plus_5_truth_table = CodeConverter.truth_table(BCD_8421, BCD_8421, lambda digit: (digit + 5) % 10)
 
 def print_ODS_3_truth_table():
     print('Таблица истинности ОДС3:')